@@ -10,11 +10,17 @@ Usage examples:
   ffmpeg -f dshow -i audio="Microphone" -ac 1 -ar 16000 -f wav - | \
     python -c "import sys,shutil; open('/tmp/cloud_whisper.pipe','wb').write(sys.stdin.buffer.read())"
 
+  # serve many concurrent clients on a Unix socket instead; each client sends
+  # one clip, half-closes, and reads back the transcription line
+  python scripts/fifo_listener.py --socket /tmp/cloud_whisper.sock --workers 4
+  socat -t 30 - UNIX-CONNECT:/tmp/cloud_whisper.sock < clip.wav
+
 Note: the helper instantiates a Transcriber and RecordingWorker locally; if the
 main application is already running and exposing a FIFO consumer hook, prefer
 using that integration instead.
 """
 import argparse
+import asyncio
 import sys
 
 
@@ -26,22 +32,43 @@ def main() -> int:
         default="/tmp/cloud_whisper_pipe",
         help="Path to FIFO (named pipe) to listen on",
     )
+    parser.add_argument(
+        "--socket",
+        "-s",
+        default=None,
+        help="Serve concurrent clients on this Unix socket instead of the FIFO",
+    )
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        default=None,
+        help="Concurrent recognizers in --socket mode (default: CPU count)",
+    )
     args = parser.parse_args()
 
     try:
         # Local imports to avoid importing heavy dependencies when not used
-        from src.core.transcriber import Transcriber
+        from src.core.transcriber import Transcriber, TranscriberError, TranscriberPool
         from src.core.workers import RecordingWorker
-        from src.core.fifo_consumer import listen_and_forward
+        from src.core.fifo_consumer import listen_and_forward, serve_unix
     except Exception as e:
         print(f"Failed to import application modules: {e}")
         return 2
 
-    transcriber = Transcriber()
-    worker = RecordingWorker(transcriber)
+    # Piped clips often carry dead air; don't spend decoding time on it
+    transcriber = Transcriber(trim_silence=True)
+    try:
+        transcriber.load_model()
+    except TranscriberError as e:
+        print(f"Unable to load model: {e}")
+        return 2
 
     try:
-        listen_and_forward(args.pipe, worker)
+        if args.socket:
+            asyncio.run(serve_unix(args.socket, TranscriberPool(transcriber, args.workers)))
+        else:
+            listen_and_forward(args.pipe, RecordingWorker(transcriber))
     except KeyboardInterrupt:
         print("Interrupted by user")
         return 0
@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
-"""Simple CLI to replay a 16kHz mono WAV into Transcriber.feed_pcm for manual testing.
+"""Simple CLI to replay 16kHz mono WAVs into Transcriber for manual testing.
 
-Usage: python scripts/replay_wav.py path/to/file.wav
+Usage: python scripts/replay_wav.py path/to/file.wav [more.wav ...]
+
+Files are memory-mapped rather than read into memory. Several files are
+transcribed concurrently via Transcriber.transcribe_batch.
 
 The WAV must be PCM 16-bit mono at 16000 Hz. If not, resample/convert with ffmpeg:
   ffmpeg -i input.wav -ac 1 -ar 16000 -f wav output_16k_mono.wav
@@ -10,35 +13,39 @@ For WSL mic forwarding see docs/WSL_MIC_FORWARDING.md
 """
 import argparse
 import sys
-import wave
+
 from src.core.transcriber import Transcriber, TranscriberError
+from src.core.wav_reader import load_wav_mmap
 
 
-def main():
-    p = argparse.ArgumentParser()
-    p.add_argument("wavfile", help="Path to 16kHz mono 16-bit WAV file")
-    args = p.parse_args()
-
+def _read_wav(path):
+    """Return the int16 samples of `path`, exiting with status 2 on bad input."""
     try:
-        wf = wave.open(args.wavfile, "rb")
-    except Exception as e:
+        return load_wav_mmap(path)
+    except OSError as e:
         print(f"Failed to open WAV: {e}")
         sys.exit(2)
-
-    if wf.getnchannels() != 1:
-        print("WAV must be mono (1 channel)")
-        sys.exit(2)
-    if wf.getsampwidth() != 2:
-        print("WAV must be 16-bit PCM (sampwidth=2)")
-        sys.exit(2)
-    if wf.getframerate() != 16000:
-        print("WAV must be 16000 Hz; resample with ffmpeg if needed")
+    except RuntimeError as e:
+        print(f"{e}; resample/convert with ffmpeg if needed")
         sys.exit(2)
 
-    data = wf.readframes(wf.getnframes())
-    wf.close()
 
-    t = Transcriber()
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("wavfiles", nargs="+", help="Path(s) to 16kHz mono 16-bit WAV files")
+    p.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        default=None,
+        help="Concurrent recognizers when several files are given (default: CPU count)",
+    )
+    args = p.parse_args()
+
+    audios = [_read_wav(path) for path in args.wavfiles]
+
+    # Recorded files often carry dead air; don't spend decoding time on it
+    t = Transcriber(trim_silence=True)
     try:
         t.load_model()
     except TranscriberError as e:
@@ -48,11 +55,16 @@ def main():
 
     print("Feeding WAV to Transcriber...")
     try:
-        text = t.feed_pcm(data)
-        print("Transcribed:", text)
+        if len(audios) == 1:
+            print("Transcribed:", t.transcribe(audios[0]))
+            return
+        for path, text in zip(args.wavfiles, t.transcribe_batch(audios, args.workers)):
+            print(f"Transcribed [{path}]:", text)
     except TranscriberError as e:
         print(f"Transcription failed: {e}")
         sys.exit(2)
+    finally:
+        t.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,82 @@
+"""Numpy kernels for audio sample conversion.
+
+Helpers here write into caller-provided buffers where possible so they can be
+used from the sounddevice callback without allocating per block.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+# Scale used to map float samples in [-1.0, 1.0] onto int16
+INT16_SCALE = 32767.0
+
+
+def float_to_int16(
+    src: np.ndarray,
+    out: Optional[np.ndarray] = None,
+    scratch: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Clip float samples to [-1.0, 1.0] and scale them to int16.
+
+    Args:
+        src: float samples of any shape.
+        out: optional int16 array with `src.size` elements to write into.
+        scratch: optional float32 array with `src.size` elements used for the
+                 clipped intermediate.
+
+    Returns:
+        `out` (or a new int16 array) holding the converted samples, with the
+        same truncation semantics as `(clip(src) * 32767).astype(np.int16)`.
+    """
+    flat = src.reshape(-1)
+    if scratch is None:
+        scratch = np.empty(flat.size, dtype=np.float32)
+    if out is None:
+        out = np.empty(flat.size, dtype=np.int16)
+    np.clip(flat, -1.0, 1.0, out=scratch)
+    np.multiply(scratch, INT16_SCALE, out=out, casting="unsafe")
+    return out
+
+
+def frame_energies(samples: np.ndarray, win: int) -> np.ndarray:
+    """Return the mean squared amplitude of each full `win`-sample frame.
+
+    A trailing partial frame is ignored.
+    """
+    n = samples.size // win
+    frames = samples[: n * win].reshape(n, win).astype(np.float32)
+    return np.einsum("ij,ij->i", frames, frames) / win
+
+
+def trim_silence(
+    samples: np.ndarray,
+    sample_rate: int,
+    frame_ms: int = 30,
+    pad_frames: int = 10,
+    min_energy: float = 1e4,
+) -> np.ndarray:
+    """Drop leading and trailing silence from 1-D int16 `samples`.
+
+    Frames louder than four times the noise floor (the 10th percentile of
+    frame energies, i.e. ~6 dB above it) and above `min_energy` count as
+    voiced. `pad_frames` frames are kept on either side of the voiced
+    region so word onsets and tails survive.
+
+    Returns:
+        A view of `samples`; empty when no frame is voiced.
+    """
+    win = max(1, sample_rate * frame_ms // 1000)
+    energies = frame_energies(samples, win)
+    if energies.size == 0:
+        return samples
+    threshold = max(4.0 * float(np.percentile(energies, 10)), min_energy)
+    voiced = np.flatnonzero(energies > threshold)
+    if voiced.size == 0:
+        return samples[:0]
+    start = max(0, int(voiced[0]) - pad_frames) * win
+    end = min(energies.size, int(voiced[-1]) + 1 + pad_frames) * win
+    if end >= energies.size * win:
+        # Keep the partial frame at the very end as well
+        end = samples.size
+    return samples[start:end]
@@ -1,72 +1,228 @@
 """FIFO consumer helper to forward WAV/raw PCM bytes into a RecordingWorker.
 
 This module provides a simple blocking loop that listens on a named pipe (FIFO)
-and forwards complete payloads to the provided worker via worker.process_pcm(pcm_bytes).
+and streams payloads to the provided worker as they arrive.
 
 The implementation expects either raw 16-bit little-endian mono PCM bytes, or a
-complete WAV file (RIFF header). It performs minimal validation and raises an
-error if the WAV format isn't 16-bit mono.
+WAV stream (RIFF header). WAV headers are parsed incrementally by
+`WavStreamParser`; it raises an error if the format isn't 16 kHz 16-bit mono.
+
+Small payloads (below `STREAM_THRESHOLD` bytes) are still forwarded in one go
+via worker.process_pcm(pcm). Larger payloads are streamed block by block
+through worker.process_pcm_chunk(chunk) and closed with
+worker.finish_pcm_stream() once the writer closes the pipe.
+
+`serve_unix` is the multi-client alternative: an asyncio Unix-domain socket
+server that accepts many concurrent audio streams and decodes each on a
+`TranscriberPool` recognizer, replying with the transcription.
 """
-from typing import Any
+from typing import Any, Optional, Union
+import asyncio
 import io
 import os
-import wave
+import stat
+import struct
+import time
+
+import numpy as np
+
+from src.core.wav_reader import UNKNOWN_SIZES, check_fmt_chunk, parse_wav_header
+
+# Size of each read() on the FIFO
+READ_BLOCK_SIZE = 64 * 1024
+# Payloads smaller than this are batched and forwarded with a single process_pcm
+STREAM_THRESHOLD = 1024 * 1024
+
+
+class WavStreamParser:
+    """Incrementally strip a WAV header from a byte stream.
+
+    Feed arbitrary blocks with `feed()`; each call returns the PCM bytes that
+    became available. If the stream doesn't start with a RIFF header it is
+    treated as raw 16-bit PCM little-endian samples. Returned chunks always
+    contain whole int16 samples; a trailing odd byte is held until the next
+    block.
+    """
+
+    def __init__(self) -> None:
+        self._pending = bytearray()
+        # "detect" -> "riff" -> "chunks" -> "data"; "raw" for headerless input
+        self._state = "detect"
+        self._fmt_seen = False
+        # Remaining bytes of the data chunk, None when unbounded
+        self._data_left: Optional[int] = None
+
+    def _take(self, n: int) -> bytes:
+        out = bytes(self._pending[:n])
+        del self._pending[:n]
+        return out
+
+    def _advance_header(self) -> None:
+        """Consume header bytes from the pending buffer while possible."""
+        if self._state == "detect":
+            if len(self._pending) < 4:
+                return
+            self._state = "riff" if self._pending[:4] == b"RIFF" else "raw"
+
+        if self._state == "riff":
+            if len(self._pending) < 12:
+                return
+            header = self._take(12)
+            if header[8:12] != b"WAVE":
+                raise RuntimeError("RIFF payload is not a WAVE file")
+            self._state = "chunks"
+
+        while self._state == "chunks":
+            if len(self._pending) < 8:
+                return
+            chunk_id, size = struct.unpack("<4sI", self._pending[:8])
+            if chunk_id == b"data":
+                if not self._fmt_seen:
+                    raise RuntimeError("WAV data chunk before fmt chunk")
+                del self._pending[:8]
+                self._data_left = None if size in UNKNOWN_SIZES else size
+                self._state = "data"
+                return
+            # Chunks are word aligned; odd sizes carry a pad byte
+            padded = size + (size & 1)
+            if len(self._pending) < 8 + padded:
+                return
+            del self._pending[:8]
+            body = self._take(padded)
+            if chunk_id == b"fmt ":
+                check_fmt_chunk(body)
+                self._fmt_seen = True
+
+    def feed(self, block: Union[bytes, bytearray, memoryview]) -> bytes:
+        """Consume `block` and return any PCM bytes now available.
+
+        `block` may be a view over a reused read buffer; its contents are
+        copied before returning.
+        """
+        if self._state == "data" and self._data_left is not None:
+            block = block[: self._data_left]
+            self._data_left -= len(block)
+        if self._state in ("raw", "data") and not self._pending:
+            # Fast path: no header work or carried byte pending
+            if len(block) & 1:
+                self._pending.append(block[-1])
+                return bytes(block[:-1])
+            return bytes(block)
+
+        self._pending.extend(block)
+        if self._state not in ("raw", "data"):
+            self._advance_header()
+            if self._state not in ("raw", "data"):
+                return b""
+            if self._data_left is not None:
+                extra = len(self._pending) - self._data_left
+                if extra > 0:
+                    del self._pending[self._data_left :]
+                self._data_left -= len(self._pending)
+
+        usable = len(self._pending) & ~1
+        return self._take(usable)
+
+    def close(self) -> bytes:
+        """Signal end of stream and return any remaining PCM bytes.
+
+        Raises:
+            RuntimeError: if the stream ended inside a WAV header.
+        """
+        if self._state == "detect":
+            # Fewer than 4 bytes: too short for a header, treat as raw PCM
+            self._state = "raw"
+            return self._take(len(self._pending) & ~1)
+        if self._state not in ("raw", "data"):
+            raise RuntimeError("Truncated WAV header")
+        # Drop a dangling odd byte; it can't form a full int16 sample
+        self._pending.clear()
+        return b""
 
 
 def _extract_pcm_from_buf(buf: bytes) -> bytes:
     """Extract raw PCM bytes from a buffer that may contain a WAV file or raw PCM.
 
-    If `buf` starts with a RIFF header, parse it and extract frames. Otherwise
-    treat `buf` as raw 16-bit PCM little-endian samples.
+    If `buf` starts with a RIFF header, locate the data chunk in place and
+    copy it out once. Otherwise treat `buf` as raw 16-bit PCM little-endian
+    samples.
     """
     if not buf:
         return b""
-
-    # WAV file
     if buf[:4] == b"RIFF":
-        with wave.open(io.BytesIO(buf), "rb") as wf:
-            sampwidth = wf.getsampwidth()
-            channels = wf.getnchannels()
-            frames = wf.readframes(wf.getnframes())
-            if sampwidth != 2 or channels != 1:
-                raise RuntimeError(
-                    f"Unsupported WAV format: sampwidth={sampwidth}, channels={channels}; expected 16-bit mono"
-                )
-            return frames
+        offset, size = parse_wav_header(buf)
+        return bytes(memoryview(buf)[offset : offset + size])
+    # Raw PCM: drop a dangling odd byte that can't form an int16 sample
+    return buf[: len(buf) & ~1]
+
+
+def _forward_stream(
+    f: io.RawIOBase, worker: Any, read_buf: Optional[bytearray] = None
+) -> None:
+    """Read one writer's payload from `f` and forward it to `worker`.
+
+    `read_buf` is the block buffer for `readinto`; pass the same one for
+    every writer to avoid reallocating it per payload.
+    """
+    parser = WavStreamParser()
+    pending = bytearray()
+    streaming = False
+    can_stream = hasattr(worker, "process_pcm_chunk")
+    # One read buffer reused for every block instead of a fresh bytes per read()
+    if read_buf is None:
+        read_buf = bytearray(READ_BLOCK_SIZE)
+    read_view = memoryview(read_buf)
+
+    try:
+        while True:
+            n = f.readinto(read_buf) or 0
+            block = read_view[:n]
+            pcm = parser.feed(block) if n else parser.close()
+            if pcm:
+                if streaming:
+                    worker.process_pcm_chunk(pcm)
+                else:
+                    pending.extend(pcm)
+                    if can_stream and len(pending) >= STREAM_THRESHOLD:
+                        # Large payload: switch to streaming and flush what we have
+                        streaming = True
+                        worker.process_pcm_chunk(bytes(pending))
+                        pending = bytearray()
+            if not n:
+                break
+    finally:
+        # Close an open stream even if the payload broke off, so the next
+        # writer doesn't append to it; errors still propagate to the caller
+        if streaming:
+            worker.finish_pcm_stream()
 
-    # Raw PCM (assume int16 little-endian mono)
-    return buf
+    if not streaming and pending:
+        # process_pcm takes any buffer; hand over the bytearray as is
+        worker.process_pcm(pending)
 
 
 def listen_and_forward(pipe_path: str, worker: Any) -> None:
-    """Create the FIFO if needed and forward any written payloads to worker.process_pcm.
+    """Create the FIFO if needed and forward any written payloads to the worker.
 
     This function blocks and loops forever, handling one writer at a time. For
-    each writer it reads until EOF (i.e., the writer closed the pipe), then
-    forwards the captured bytes to the worker.
+    each writer it reads in `READ_BLOCK_SIZE` blocks until EOF (i.e., the
+    writer closed the pipe), streaming PCM to the worker as it arrives.
     """
     if not os.path.exists(pipe_path):
         # Create FIFO with user-only permissions
         os.mkfifo(pipe_path, 0o600)
 
     print(f"Listening on FIFO: {pipe_path}")
+    read_buf = bytearray(READ_BLOCK_SIZE)
 
     while True:
         try:
-            with open(pipe_path, "rb") as f:
-                buf = f.read()  # blocks until writer closes
-                if not buf:
-                    # Writer closed without data; ignore
-                    continue
-
+            fd = os.open(pipe_path, os.O_RDONLY)  # blocks until a writer opens
+            with io.FileIO(fd, "rb") as f:
                 try:
-                    pcm = _extract_pcm_from_buf(buf)
-                except Exception as e:
+                    _forward_stream(f, worker, read_buf)
+                except RuntimeError as e:
                     print(f"Failed to parse incoming payload: {e}")
-                    continue
-
-                try:
-                    worker.process_pcm(pcm)
                 except Exception as e:
                     print(f"Worker failed to process PCM: {e}")
         except KeyboardInterrupt:
@@ -75,6 +231,64 @@ def listen_and_forward(pipe_path: str, worker: Any) -> None:
         except Exception as e:
             print(f"FIFO listener error: {e}")
             # Small sleep to avoid hot loop on persistent failures
-            import time
-
             time.sleep(1)
+
+
+async def _handle_connection(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, pool: Any
+) -> None:
+    """Read one client's payload and reply with its transcription.
+
+    The client sends WAV or raw PCM and half-closes its end; the reply is
+    the UTF-8 text followed by a newline.
+    """
+    parser = WavStreamParser()
+    pcm = bytearray()
+    try:
+        while True:
+            block = await reader.read(READ_BLOCK_SIZE)
+            if not block:
+                pcm.extend(parser.close())
+                break
+            pcm.extend(parser.feed(block))
+        audio = np.frombuffer(pcm, dtype=np.int16)
+        text = await asyncio.wrap_future(pool.submit(audio))
+        writer.write(text.encode("utf-8") + b"\n")
+        await writer.drain()
+    except RuntimeError as e:
+        print(f"Failed to parse incoming payload: {e}")
+    except Exception as e:
+        print(f"Failed to transcribe incoming payload: {e}")
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except Exception:
+            pass
+
+
+async def serve_unix(socket_path: str, pool: Any) -> None:
+    """Serve transcriptions on a Unix-domain socket until cancelled.
+
+    Every connection is one independent stream; connections are read
+    concurrently and decoded in parallel on `pool` (a `TranscriberPool`).
+    A stale socket left at `socket_path` by a previous run is replaced.
+    """
+    try:
+        if stat.S_ISSOCK(os.stat(socket_path).st_mode):
+            os.unlink(socket_path)
+    except FileNotFoundError:
+        pass
+
+    # Create the socket user-only from the start; a chmod after bind would
+    # leave a window where other users could connect
+    old_umask = os.umask(0o177)
+    try:
+        server = await asyncio.start_unix_server(
+            lambda r, w: _handle_connection(r, w, pool), path=socket_path
+        )
+    finally:
+        os.umask(old_umask)
+    print(f"Listening on socket: {socket_path}")
+    async with server:
+        await server.serve_forever()
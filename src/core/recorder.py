@@ -1,6 +1,8 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Union
 import numpy as np
 
+from src.core.dsp import float_to_int16
+
 try:
     import sounddevice as sd
 except Exception:  # sounddevice may not be available in headless/test env
@@ -20,26 +22,42 @@ class AudioRecorder:
       - get_default_device() -> Optional[int]
       - start() -> None
       - stop() -> numpy.ndarray | None
+      - read_new_samples() -> numpy.ndarray
       - is_recording() -> bool
 
     Notes:
-      - Uses `sounddevice.InputStream` with samplerate=16000, channels=1, dtype='int16'.
-      - Keeps a simple list buffer of frames appended by callback.
+      - Uses `sounddevice.InputStream` with samplerate=16000, channels=1, dtype='int16'
+        and PortAudio's low suggested latency by default.
+      - The callback writes samples into one preallocated int16 buffer that
+        doubles when full; `stop()` returns a view of it without copying.
       - Does not perform threading or advanced buffering responsibilities.
     """
 
+    # Initial capture buffer length; grows by doubling for longer recordings
+    INITIAL_BUFFER_SECONDS = 30
+
     def __init__(
-        self, sample_rate: int = 16000, block_size: int = 8000, channels: int = 1
+        self,
+        sample_rate: int = 16000,
+        block_size: int = 8000,
+        channels: int = 1,
+        latency: Union[str, float] = "low",
     ) -> None:
         self._device_id: Optional[int] = None
         self._stream: Optional[Any] = None
-        self._buffer: List[np.ndarray] = []
         self._samplerate = int(sample_rate)
         self.block_size = int(block_size)
         self.channels = int(channels)
+        # PortAudio suggested input latency ("low", "high" or seconds)
+        self.latency = latency
         self._dtype = "int16"
         self._recording: bool = False
-        self._audio_data: List[np.ndarray] = []
+        self._audio_buf: np.ndarray = np.empty(0, dtype=np.int16)
+        self._write_idx: int = 0
+        # Samples up to here were already handed out by read_new_samples()
+        self._read_idx: int = 0
+        # Reused float32 buffer for converting float callback blocks
+        self._scratch: np.ndarray = np.empty(0, dtype=np.float32)
         self._overflow_count: int = 0
 
     def list_devices(self) -> List[Dict]:
@@ -104,7 +122,9 @@ class AudioRecorder:
     def sample_rate(self) -> int:
         return self._samplerate
 
-    def _audio_callback(self, indata, frames, time, status):
+    def _audio_callback(
+        self, indata: np.ndarray, frames: int, time: Any, status: Any
+    ) -> None:
         # indata is shape (frames, channels); convert to 1-D int16
         if status:
             # Track input overflow events
@@ -114,25 +134,30 @@ class AudioRecorder:
             except Exception:
                 # ignore any unexpected status shape
                 pass
-        if indata is None:
+        if indata is None or not self._recording:
             return
-        arr = np.asarray(indata)
-        if arr.dtype != np.int16:
-            # sounddevice may provide float32; convert to int16 preserving scale
-            # clip to [-1,1] if float
-            if np.issubdtype(arr.dtype, np.floating):
-                arr = np.clip(arr, -1.0, 1.0)
-                arr = (arr * 32767).astype(np.int16)
-            else:
-                arr = arr.astype(np.int16)
-        # flatten to 1-D and store
-        try:
-            if self._recording:
-                self._audio_data.append(arr.copy())
-        except Exception:
-            # fallback: append flattened array
-            if self._recording:
-                self._audio_data.append(np.asarray(arr).flatten())
+        self._append_samples(np.asarray(indata).reshape(-1))
+
+    def _append_samples(self, samples: np.ndarray) -> None:
+        """Write `samples` into the capture buffer as int16, doubling it when full.
+
+        Float input (sounddevice may provide float32) is clipped and scaled
+        directly into the buffer without intermediate arrays.
+        """
+        start = self._write_idx
+        end = start + samples.size
+        if end > self._audio_buf.size:
+            grown = np.empty(max(end, self._audio_buf.size * 2), dtype=np.int16)
+            grown[:start] = self._audio_buf[:start]
+            self._audio_buf = grown
+        dst = self._audio_buf[start:end]
+        if np.issubdtype(samples.dtype, np.floating):
+            if self._scratch.size < samples.size:
+                self._scratch = np.empty(samples.size, dtype=np.float32)
+            float_to_int16(samples, out=dst, scratch=self._scratch[: samples.size])
+        else:
+            np.copyto(dst, samples, casting="unsafe")
+        self._write_idx = end
 
     def _validate_device(self, device_id: int) -> bool:
         """Check if device supports required sample rate and channels."""
@@ -165,11 +190,32 @@ class AudioRecorder:
         if self._recording:
             return
 
-        # Prepare audio data buffer and reset overflow counter
-        self._audio_data = []
+        # Prepare a fresh capture buffer (a previous stop() may still hand out
+        # a view of the old one) and reset overflow counter
+        self._audio_buf = np.empty(
+            self.sample_rate * self.INITIAL_BUFFER_SECONDS * self.channels,
+            dtype=np.int16,
+        )
+        self._write_idx = 0
+        self._read_idx = 0
         self._overflow_count = 0
         self._recording = True
+        try:
+            self._open_stream()
+        except Exception:
+            # Leave the recorder startable again: a retry must not hit the
+            # early return above with no stream open
+            self._recording = False
+            stream, self._stream = self._stream, None
+            if stream is not None:
+                try:
+                    stream.close()
+                except Exception:
+                    pass
+            raise
 
+    def _open_stream(self) -> None:
+        """Pick and validate the input device, then open and start its stream."""
         device = (
             self.device_id if self.device_id is not None else self.get_default_device()
         )
@@ -202,9 +248,11 @@ class AudioRecorder:
                     dtype=self._dtype,
                     callback=self._audio_callback,
                     blocksize=self.block_size,
+                    latency=self.latency,
                 )
             except TypeError:
-                # Some mocked or older InputStream implementations may not accept blocksize
+                # Some mocked or older InputStream implementations may not accept
+                # blocksize/latency
                 self._stream = sd.InputStream(
                     samplerate=self.sample_rate,
                     device=device,
@@ -218,7 +266,11 @@ class AudioRecorder:
             raise AudioRecorderError(f"Failed to start recording: {e}")
 
     def stop(self) -> np.ndarray:
-        """Stop recording and return audio data as 1-D numpy array of int16."""
+        """Stop recording and return audio data as 1-D numpy array of int16.
+
+        The result is a view into the capture buffer; the recorder allocates a
+        new buffer on the next `start()` so the view stays valid.
+        """
         if not self._recording:
             return np.array([], dtype=np.int16)
 
@@ -230,10 +282,27 @@ class AudioRecorder:
         finally:
             self._stream = None
 
-        if self._audio_data:
-            combined = np.concatenate(self._audio_data, axis=0).flatten()
-            return combined.astype(np.int16)
-        return np.array([], dtype=np.int16)
+        audio = self._audio_buf[: self._write_idx]
+        self._audio_buf = np.empty(0, dtype=np.int16)
+        self._write_idx = 0
+        self._read_idx = 0
+        return audio
+
+    def read_new_samples(self) -> np.ndarray:
+        """Return int16 samples captured since the previous call (may be empty).
+
+        Intended to be polled from one consumer thread while recording so
+        audio can be processed incrementally. The result is a view into the
+        capture buffer.
+        """
+        # Read the write index before the buffer: the callback swaps in a
+        # grown buffer before advancing the index, so either buffer holds
+        # valid samples up to `end`.
+        end = self._write_idx
+        buf = self._audio_buf
+        start = self._read_idx
+        self._read_idx = end
+        return buf[start:end]
 
     def is_recording(self) -> bool:
         """Check if currently recording."""
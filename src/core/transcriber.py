@@ -1,10 +1,17 @@
 from __future__ import annotations
 
 import json
-from typing import Optional, TYPE_CHECKING, Any
+import os
+import queue
+import re
+import threading
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, TYPE_CHECKING, Any, Union
 
 import numpy as np
 
+from src.core.dsp import float_to_int16, trim_silence
 from src.utils.paths import get_model_path
 
 try:
@@ -23,6 +30,54 @@ class TranscriberError(Exception):
     """Raised when transcription operations fail."""
 
 
+# Matches the string field of Vosk's small result objects, e.g.
+# '{\n  "text" : "..."\n}'; values containing escapes go through json instead
+_RESULT_FIELD_RE = re.compile(r'"(text|partial)"\s*:\s*"([^"\\]*)"')
+
+# Loaded Vosk models keyed by path, shared by every Transcriber in the process
+_MODEL_CACHE: Dict[str, Any] = {}
+_MODEL_CACHE_LOCK = threading.Lock()
+# Live TranscriberPools; their recognizers keep cached models alive
+_POOLS: "weakref.WeakSet[TranscriberPool]" = weakref.WeakSet()
+
+
+def _get_model(model_path: str) -> Any:
+    """Return the cached Vosk model for `model_path`, loading it on first use."""
+    with _MODEL_CACHE_LOCK:
+        model = _MODEL_CACHE.get(model_path)
+        if model is None:
+            model = Model(model_path)
+            _MODEL_CACHE[model_path] = model
+        return model
+
+
+def preload_model(model_path: Optional[str] = None) -> None:
+    """Load the Vosk model into the shared cache ahead of first use.
+
+    Call at startup (e.g. from a background thread) so the first recording
+    doesn't wait on disk I/O. Calling it before forking lets child processes
+    share the model pages copy-on-write.
+
+    Raises:
+        TranscriberError: if the model cannot be loaded or vosk is not installed.
+    """
+    if Model is None:
+        raise TranscriberError("Vosk is not installed in this environment")
+    path = str(model_path or get_model_path())
+    try:
+        _get_model(path)
+    except Exception as e:
+        raise TranscriberError(f"Failed to load Vosk model from {path}: {e}")
+
+
+def clear_model_cache() -> None:
+    """Drop all cached models and close live pools (mainly for tests)."""
+    with _MODEL_CACHE_LOCK:
+        _MODEL_CACHE.clear()
+    for pool in list(_POOLS):
+        pool.close()
+
+
 class Transcriber:
     """Wraps a Vosk Model for offline speech-to-text.
 
@@ -30,17 +85,35 @@ class Transcriber:
       t = Transcriber()
       t.load_model()
       text = t.transcribe(audio_array)
+
+    Streaming usage (decode while audio is still being captured):
+      t.feed_chunk(pcm_bytes)  # repeatedly
+      text = t.finalize()
     """
 
     def __init__(
-        self, model_path: Optional[str] = None, sample_rate: int = 16000
+        self,
+        model_path: Optional[str] = None,
+        sample_rate: int = 16000,
+        trim_silence: bool = False,
     ) -> None:
         self.sample_rate: int = int(sample_rate)
+        # Drop leading/trailing silence before decoding complete recordings
+        self.trim_silence: bool = bool(trim_silence)
         self._model_path = str(model_path or get_model_path())
         self._model: Optional[VoskModel] = None
+        # One recognizer reused across calls (Reset() between utterances);
+        # the lock serializes callers from different worker threads.
+        self._recognizer: Optional[Any] = None
+        self._lock = threading.Lock()
+        # Streaming state for feed_chunk()/finalize()
+        self._stream_active: bool = False
+        self._segments: List[str] = []
+        # Created on first transcribe_batch() call
+        self._pool: Optional["TranscriberPool"] = None
 
     def load_model(self) -> None:
-        """Load the Vosk model from disk.
+        """Load the Vosk model, reusing it if already loaded in this process.
 
         Raises:
             TranscriberError: if the model cannot be loaded or vosk is not installed.
@@ -48,7 +121,9 @@ class Transcriber:
         if Model is None:
             raise TranscriberError("Vosk is not installed in this environment")
         try:
-            self._model = Model(self._model_path)
+            self._model = _get_model(self._model_path)
+            if KaldiRecognizer is not None:
+                self._recognizer = KaldiRecognizer(self._model, self.sample_rate)
         except Exception as e:
             raise TranscriberError(
                 f"Failed to load Vosk model from {self._model_path}: {e}"
@@ -76,62 +151,203 @@ class Transcriber:
             raise TranscriberError("Model not loaded. Call load_model() first.")
 
         try:
-            # Normalize and validate audio
-            if audio is None:
-                return ""
-
-            arr = np.asarray(audio)
-
+            arr = self._prepare_audio(audio)
             if arr.size == 0:
                 return ""
 
-            # If float, scale to int16 range
-            if np.issubdtype(arr.dtype, np.floating):
-                arr = np.clip(arr, -1.0, 1.0)
-                arr = (arr * 32767).astype(np.int16)
-            elif arr.dtype != np.int16:
-                arr = arr.astype(np.int16)
-
-            # Ensure 1-D
-            arr = arr.flatten()
-
-            if KaldiRecognizer is None:
+            if self._recognizer is None:
                 raise TranscriberError(
                     "Vosk recognizer unavailable (vosk import failed)"
                 )
 
-            recognizer = KaldiRecognizer(self._model, self.sample_rate)
-            # Process in chunks to avoid large-memory AcceptWaveform calls
-            chunk_size = 4000
-            for i in range(0, arr.size, chunk_size):
-                chunk = arr[i : i + chunk_size]
-                recognizer.AcceptWaveform(chunk.tobytes())
-
-            # Final result contains JSON with 'text' field
-            try:
-                result_json = recognizer.FinalResult()
-                data = json.loads(result_json)
-                return data.get("text", "") or ""
-            except Exception:
-                # As a fallback, try Result() then FinalResult()
-                try:
-                    res = recognizer.Result()
-                    parsed = json.loads(res)
-                    return parsed.get("text", "") or ""
-                except Exception as e:
-                    raise TranscriberError(f"Failed to parse recognition result: {e}")
+            with self._lock:
+                # A one-shot decode discards any stream left open by feed_chunk()
+                self._stream_active = False
+                self._segments = []
+                return self._decode(self._recognizer, arr)
 
         except TranscriberError:
             raise
         except Exception as e:
             raise TranscriberError(f"Transcription failed: {e}")
 
-    def feed_pcm(self, pcm_bytes: bytes) -> str:
+    def _prepare_audio(self, audio: Optional[np.ndarray]) -> np.ndarray:
+        """Normalize `audio` to a contiguous 1-D int16 array (may be empty).
+
+        Leading/trailing silence is trimmed when `self.trim_silence` is set.
+        """
+        if audio is None:
+            return np.empty(0, dtype=np.int16)
+
+        arr = np.asarray(audio)
+
+        # If float, scale to int16 range
+        if np.issubdtype(arr.dtype, np.floating):
+            arr = float_to_int16(arr)
+        elif arr.dtype != np.int16:
+            arr = arr.astype(np.int16)
+
+        # Ensure 1-D and contiguous (no copy when already so)
+        arr = np.ascontiguousarray(arr.reshape(-1))
+        if self.trim_silence:
+            arr = trim_silence(arr, self.sample_rate)
+        return arr
+
+    def _decode(self, recognizer: Any, arr: np.ndarray) -> str:
+        """Run `recognizer` over contiguous int16 `arr` and return the text.
+
+        The caller must own `recognizer` for the duration of the call (hold
+        `self._lock` for the shared one).
+        """
+        recognizer.Reset()
+        # Process in 1 s chunks to avoid large-memory AcceptWaveform calls
+        # while keeping Python/C transitions few. Slice a byte view of the
+        # array; Vosk's cffi binding only takes bytes, so each slice is
+        # copied exactly once at the call boundary. Input stays int16: Kaldi's
+        # feature front end has no reduced-precision (e.g. int8) input path.
+        mv = memoryview(arr).cast("B")
+        chunk_bytes = self.sample_rate * arr.itemsize
+        for i in range(0, mv.nbytes, chunk_bytes):
+            recognizer.AcceptWaveform(bytes(mv[i : i + chunk_bytes]))
+
+        # Final result contains JSON with 'text' field
+        try:
+            return self._result_text(recognizer.FinalResult())
+        except Exception:
+            # As a fallback, try Result() then FinalResult()
+            try:
+                return self._result_text(recognizer.Result())
+            except Exception as e:
+                raise TranscriberError(f"Failed to parse recognition result: {e}")
+
+    def transcribe_batch(
+        self, audios: List[np.ndarray], workers: Optional[int] = None
+    ) -> List[str]:
+        """Transcribe several independent recordings concurrently.
+
+        Uses a `TranscriberPool` of recognizers sharing this instance's model,
+        created on first use with `workers` recognizers (default: CPU count)
+        and rebuilt when a different `workers` is passed later.
+
+        Returns:
+            One transcription per input, in input order.
+
+        Raises:
+            TranscriberError: if model not loaded or any transcription fails.
+        """
+        if not self.is_model_loaded():
+            raise TranscriberError("Model not loaded. Call load_model() first.")
+        if self._pool is not None and (
+            self._pool.closed or (workers is not None and workers != self._pool.size)
+        ):
+            self.close()
+        if self._pool is None:
+            self._pool = TranscriberPool(self, workers)
+        return self._pool.transcribe_batch(audios)
+
+    def close(self) -> None:
+        """Shut down the `transcribe_batch` pool, if any.
+
+        The model stays loaded; a later `transcribe_batch` starts a new pool.
+        """
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.close()
+
+    @staticmethod
+    def _result_text(result_json: str, key: str = "text") -> str:
+        """Return `key` from a Vosk JSON result, or an empty string.
+
+        Plain values are read with a regex; anything else (escapes, other
+        shapes) falls back to a full JSON parse.
+        """
+        m = _RESULT_FIELD_RE.search(result_json)
+        if m is not None and m.group(1) == key:
+            return m.group(2)
+        return json.loads(result_json).get(key, "") or ""
+
+    def feed_chunk(
+        self, pcm: bytes, on_partial: Optional[Callable[[str], None]] = None
+    ) -> None:
+        """Feed one block of raw int16 PCM into the streaming recognizer.
+
+        The first call after `finalize()` starts a new utterance. Segments
+        Vosk finalizes mid-stream are kept until `finalize()`. When
+        `on_partial` is given it is called after the block is decoded with
+        the running transcript: finalized segments followed by the current
+        partial hypothesis.
+
+        Do not interleave with `transcribe()` on the same instance while a
+        stream is open; both use the shared recognizer.
+
+        Raises:
+            TranscriberError: if model not loaded or on processing errors.
+        """
+        if not self.is_model_loaded():
+            raise TranscriberError("Model not loaded. Call load_model() first.")
+        if self._recognizer is None:
+            raise TranscriberError("Vosk recognizer unavailable (vosk import failed)")
+        if not pcm:
+            return
+        try:
+            running = ""
+            with self._lock:
+                recognizer = self._recognizer
+                if not self._stream_active:
+                    recognizer.Reset()
+                    self._segments = []
+                    self._stream_active = True
+                if recognizer.AcceptWaveform(pcm):
+                    text = self._result_text(recognizer.Result())
+                    if text:
+                        self._segments.append(text)
+                if on_partial is not None:
+                    partial = self._result_text(recognizer.PartialResult(), "partial")
+                    words = self._segments + [partial] if partial else self._segments
+                    running = " ".join(words)
+            if running and on_partial is not None:
+                on_partial(running)
+        except Exception as e:
+            raise TranscriberError(f"feed_chunk failed: {e}")
+
+    def finalize(self) -> str:
+        """Finish the stream opened by `feed_chunk` and return its text.
+
+        Returns an empty string when no audio was fed since the last call.
+
+        Raises:
+            TranscriberError: if the final result cannot be parsed.
+        """
+        with self._lock:
+            if not self._stream_active or self._recognizer is None:
+                return ""
+            self._stream_active = False
+            segments, self._segments = self._segments, []
+            try:
+                final = self._result_text(self._recognizer.FinalResult())
+            except Exception as e:
+                raise TranscriberError(f"Failed to parse recognition result: {e}")
+        if final:
+            segments.append(final)
+        return " ".join(segments)
+
+    def reset_stream(self) -> None:
+        """Abandon the stream opened by `feed_chunk` without decoding it.
+
+        Used after a failed take so its audio and segments don't leak into
+        the next one; the next `feed_chunk` starts a fresh utterance.
+        """
+        with self._lock:
+            self._stream_active = False
+            self._segments = []
+
+    def feed_pcm(self, pcm_bytes: Union[bytes, bytearray, memoryview]) -> str:
         """Feed raw PCM int16 bytes (mono, sample_rate) and return transcription.
 
         This is a small injection API intended for testing and CI where a real
         microphone is unavailable. Expects raw little-endian int16 PCM bytes
-        matching self.sample_rate and mono channels.
+        matching self.sample_rate and mono channels; any buffer-protocol
+        object is accepted and viewed without copying.
         """
         if not self.is_model_loaded():
             raise TranscriberError("Model not loaded. Call load_model() first.")
@@ -142,3 +358,61 @@ class Transcriber:
             return self.transcribe(arr)
         except Exception as e:
             raise TranscriberError(f"feed_pcm failed: {e}")
+
+
+class TranscriberPool:
+    """Pre-warmed recognizers for decoding several recordings in parallel.
+
+    All recognizers share the loaded model of the given `Transcriber`. Each
+    task checks a recognizer out of an idle queue, decodes, and returns it.
+    Vosk releases the GIL while decoding, so threads use separate cores.
+    """
+
+    def __init__(self, transcriber: Transcriber, size: Optional[int] = None) -> None:
+        if not transcriber.is_model_loaded():
+            raise TranscriberError("Model not loaded. Call load_model() first.")
+        if KaldiRecognizer is None:
+            raise TranscriberError("Vosk recognizer unavailable (vosk import failed)")
+        self._transcriber = transcriber
+        self.size: int = max(1, int(size or os.cpu_count() or 1))
+        self._idle: "queue.Queue[Any]" = queue.Queue()
+        for _ in range(self.size):
+            self._idle.put(
+                KaldiRecognizer(transcriber._model, transcriber.sample_rate)
+            )
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.size, thread_name_prefix="transcriber"
+        )
+        self.closed = False
+        _POOLS.add(self)
+
+    def _transcribe_one(self, audio: np.ndarray) -> str:
+        try:
+            arr = self._transcriber._prepare_audio(audio)
+            if arr.size == 0:
+                return ""
+            recognizer = self._idle.get()
+            try:
+                return self._transcriber._decode(recognizer, arr)
+            finally:
+                self._idle.put(recognizer)
+        except TranscriberError:
+            raise
+        except Exception as e:
+            raise TranscriberError(f"Transcription failed: {e}")
+
+    def submit(self, audio: np.ndarray) -> "Future[str]":
+        """Queue one recording for transcription and return its future.
+
+        The future raises `TranscriberError` if transcription fails.
+        """
+        return self._executor.submit(self._transcribe_one, audio)
+
+    def transcribe_batch(self, audios: List[np.ndarray]) -> List[str]:
+        """Transcribe `audios` concurrently and return texts in input order."""
+        return list(self._executor.map(self._transcribe_one, audios))
+
+    def close(self) -> None:
+        """Shut down the worker threads."""
+        self.closed = True
+        self._executor.shutdown(wait=True)
@@ -1,12 +1,16 @@
 """Translator wrapper with engine fallback (Google -> Bing).
 
 Uses the `translators` package's `translate_text` function and exposes a
-small, testable `Translator` class for the app.
+small, testable `Translator` class for the app. The package already keeps a
+keep-alive `requests.Session` per engine, so connections are reused across
+calls.
 """
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+import functools
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import translators as ts
 
@@ -15,13 +19,33 @@ class TranslatorError(Exception):
     pass
 
 
+def _google_text(data: Any) -> str:
+    # Detailed Google results are the raw [[translated, source, ...], ...] list
+    return "".join(item[0] for item in data[0] if isinstance(item[0], str))
+
+
+def _bing_text(data: Any) -> str:
+    return data["translations"][0]["text"]
+
+
+# Pull the translated text out of an engine's detailed (non-str) result
+_EXTRACTORS: Dict[str, Callable[[Any], str]] = {
+    "google": _google_text,
+    "bing": _bing_text,
+}
+
+
 class Translator:
     """Translate text from Portuguese (pt) to supported target languages.
 
     Behavior:
     - Returns empty string for whitespace-only input.
-    - Tries engines in order: Google then Bing, with a 10s timeout each.
-    - Tracks last engine used in `self._last_engine`.
+    - Hedges engines in order: Google first; Bing is started as soon as
+      Google fails or hasn't answered within `HEDGE_DELAY` seconds, and the
+      first successful answer wins. Each request has a 10s timeout.
+    - Caches the last `CACHE_SIZE` successful translations.
+    - Tracks last engine used in `self._last_engine`, including cache hits.
+    - Call `close()` when done to release the engine threads.
     """
 
     SUPPORTED_LANGUAGES: Dict[str, str] = {
@@ -36,8 +60,23 @@ class Translator:
 
     ENGINES: List[str] = ["google", "bing"]
 
+    # Seconds to wait on an engine before also starting the next one
+    HEDGE_DELAY: float = 1.5
+    # Per-request timeout passed to the translators package
+    TIMEOUT: float = 10
+    CACHE_SIZE: int = 1024
+
     def __init__(self) -> None:
         self._last_engine: Optional[str] = None
+        # Cancelled losers keep running until their timeout; leave room so a
+        # new request can still start every engine right away
+        self._executor = ThreadPoolExecutor(
+            max_workers=2 * len(self.ENGINES), thread_name_prefix="translator"
+        )
+        # Exceptions are not cached, so failed lookups are retried
+        self._cached_translate = functools.lru_cache(maxsize=self.CACHE_SIZE)(
+            self._hedged_translate
+        )
 
     def translate(
         self, text: str, target_language: str = "English", source_language: str = "pt"
@@ -64,29 +103,79 @@ class Translator:
         if not target_code:
             raise TranslatorError(f"Unsupported target language: {target_language}")
 
-        last_exc: Optional[Exception] = None
+        result, engine = self._cached_translate(text, target_code, source_language)
+        self._last_engine = engine
+        return result
+
+    def close(self) -> None:
+        """Drop queued engine requests and release the worker threads.
+
+        Requests already in flight are left to finish in the background.
+        """
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._cached_translate.cache_clear()
 
-        for engine in self.ENGINES:
-            try:
-                # translators.translate_text signature:
-                # translate_text(query_text, translator='bing', from_language='auto', to_language='en', **kwargs)
-                result = ts.translate_text(
-                    query_text=text,
-                    translator=engine,
-                    from_language=source_language,
-                    to_language=target_code,
-                    timeout=10,
+    def _translate_with(
+        self, engine: str, text: str, target_code: str, source_language: str
+    ) -> str:
+        # translators.translate_text signature:
+        # translate_text(query_text, translator='bing', from_language='auto', to_language='en', **kwargs)
+        result = ts.translate_text(
+            query_text=text,
+            translator=engine,
+            from_language=source_language,
+            to_language=target_code,
+            timeout=self.TIMEOUT,
+            is_detail_result=False,
+        )
+        if isinstance(result, str):
+            return result
+        # Some engine versions still return the detailed payload
+        extract = _EXTRACTORS.get(engine)
+        try:
+            if extract is None:
+                raise KeyError(engine)
+            return extract(result)
+        except Exception:
+            raise TranslatorError(f"Unexpected {engine} result: {type(result).__name__}")
+
+    def _hedged_translate(
+        self, text: str, target_code: str, source_language: str
+    ) -> Tuple[str, str]:
+        """Race engines in preference order; return the first `(text, engine)`."""
+        last_exc: Optional[Exception] = None
+        engines = iter(self.ENGINES)
+        pending: Dict[Future, str] = {}
+
+        def launch_next() -> None:
+            engine = next(engines, None)
+            if engine is not None:
+                fut = self._executor.submit(
+                    self._translate_with, engine, text, target_code, source_language
                 )
-                self._last_engine = engine
-                # result may be dict if is_detail_result, ensure string
-                if isinstance(result, dict):
-                    # try to extract best string representation
-                    result = str(result)
-                return result
-            except Exception as e:  # keep broad to allow network/3rd-party failures
-                last_exc = e
-                # try next engine
+                pending[fut] = engine
+
+        launch_next()
+        while pending:
+            done, _ = wait(pending, timeout=self.HEDGE_DELAY, return_when=FIRST_COMPLETED)
+            if not done:
+                # Current engine is slow: hedge with the next one
+                launch_next()
                 continue
+            # Prefer the earlier engine when several finish together
+            for fut in sorted(done, key=lambda f: self.ENGINES.index(pending[f])):
+                engine = pending.pop(fut)
+                try:
+                    result = fut.result()
+                except Exception as e:  # keep broad to allow network/3rd-party failures
+                    last_exc = e
+                    continue
+                for loser in pending:
+                    loser.cancel()
+                return result, engine
+            if not pending:
+                # Everything in flight failed; try the next engine right away
+                launch_next()
 
         # all engines failed
         raise TranslatorError(f"All translation engines failed: {last_exc}")
@@ -0,0 +1,123 @@
+"""Zero-copy WAV parsing for complete buffers and files.
+
+`parse_wav_header` walks the RIFF chunk list of an in-memory buffer with
+`struct` and returns where the PCM samples live; `load_wav_mmap` maps a file
+and wraps its data chunk in an int16 numpy array without reading or copying
+it. Only 16 kHz 16-bit mono PCM is accepted, matching what `Transcriber`
+expects.
+"""
+
+import mmap
+import os
+import struct
+from typing import Tuple, Union
+
+import numpy as np
+
+EXPECTED_RATE = 16000
+EXPECTED_SAMPWIDTH = 2
+EXPECTED_CHANNELS = 1
+
+# Placeholder sizes written by streaming encoders (e.g. ffmpeg to a pipe)
+UNKNOWN_SIZES = (0, 0xFFFFFFFF)
+
+BufferLike = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+# Bytes 12..40 of the canonical 44-byte header most encoders write for
+# 16 kHz 16-bit mono PCM: a 16-byte fmt chunk directly followed by data
+CANONICAL_HEADER_LEN = 44
+_CANONICAL_FMT = b"fmt " + struct.pack(
+    "<IHHIIHH",
+    16,
+    1,
+    EXPECTED_CHANNELS,
+    EXPECTED_RATE,
+    EXPECTED_RATE * EXPECTED_SAMPWIDTH * EXPECTED_CHANNELS,
+    EXPECTED_SAMPWIDTH * EXPECTED_CHANNELS,
+    EXPECTED_SAMPWIDTH * 8,
+) + b"data"
+
+
+def check_fmt_chunk(body: BufferLike) -> None:
+    """Validate a WAV `fmt ` chunk body.
+
+    Raises:
+        RuntimeError: if the chunk is malformed or not 16 kHz 16-bit mono.
+    """
+    if len(body) < 16:
+        raise RuntimeError("Malformed WAV fmt chunk")
+    _, channels, rate, _, _, bits = struct.unpack_from("<HHIIHH", body)
+    sampwidth = bits // 8
+    if (
+        sampwidth != EXPECTED_SAMPWIDTH
+        or channels != EXPECTED_CHANNELS
+        or rate != EXPECTED_RATE
+    ):
+        raise RuntimeError(
+            f"Unsupported WAV format: sampwidth={sampwidth}, channels={channels}, "
+            f"rate={rate}; expected 16-bit mono at {EXPECTED_RATE} Hz"
+        )
+
+
+def parse_wav_header(buf: BufferLike) -> Tuple[int, int]:
+    """Locate the PCM data of a complete WAV file held in `buf`.
+
+    Returns:
+        (offset, size) of the data chunk in bytes. `size` is clamped to the
+        buffer and rounded down to whole int16 samples.
+
+    Raises:
+        RuntimeError: if `buf` is not a supported WAV file.
+    """
+    total = len(buf)
+    if total < 12 or buf[:4] != b"RIFF" or buf[8:12] != b"WAVE":
+        raise RuntimeError("Payload is not a RIFF/WAVE file")
+
+    if total >= CANONICAL_HEADER_LEN and buf[12:40] == _CANONICAL_FMT:
+        # Common case: skip the chunk walk entirely
+        (size,) = struct.unpack_from("<I", buf, 40)
+        available = total - CANONICAL_HEADER_LEN
+        if size in UNKNOWN_SIZES or size > available:
+            size = available
+        return CANONICAL_HEADER_LEN, size & ~1
+
+    pos = 12
+    fmt_seen = False
+    while pos + 8 <= total:
+        chunk_id, size = struct.unpack_from("<4sI", buf, pos)
+        pos += 8
+        if chunk_id == b"fmt ":
+            check_fmt_chunk(buf[pos : pos + size])
+            fmt_seen = True
+        elif chunk_id == b"data":
+            if not fmt_seen:
+                raise RuntimeError("WAV data chunk before fmt chunk")
+            available = total - pos
+            if size in UNKNOWN_SIZES or size > available:
+                size = available
+            return pos, size & ~1
+        # Chunks are word aligned; odd sizes carry a pad byte
+        pos += size + (size & 1)
+
+    raise RuntimeError("WAV file has no data chunk")
+
+
+def load_wav_mmap(path: str) -> np.ndarray:
+    """Memory-map the WAV file at `path` and return its samples.
+
+    The returned read-only int16 array is a view over the mapping; pages
+    are loaded lazily by the OS and the mapping lives as long as the array.
+
+    Raises:
+        OSError: if the file cannot be opened or mapped.
+        RuntimeError: if the file is not a supported WAV file.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        if os.fstat(fd).st_size == 0:
+            raise RuntimeError("Payload is not a RIFF/WAVE file")
+        mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    finally:
+        os.close(fd)
+    offset, size = parse_wav_header(mm)
+    return np.frombuffer(mm, dtype=np.int16, count=size // 2, offset=offset)
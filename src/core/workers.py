@@ -4,10 +4,12 @@ RecordingWorker implements background recording and transcription while
 emitting Qt signals for UI consumption. It never updates UI directly.
 """
 
-from typing import Optional
+import threading
+from array import array
+from typing import Callable, Optional, Tuple, Union
 
 import numpy as np
-from PySide6.QtCore import QThread, QMutex
+from PySide6.QtCore import QRunnable, QThread, QThreadPool
 
 from src.core.recorder import AudioRecorder, AudioRecorderError
 from src.core.transcriber import Transcriber, TranscriberError
@@ -19,7 +21,10 @@ class RecordingWorker(QThread):
     """Worker thread for recording and transcription.
 
     The worker records audio using `AudioRecorder` until `stop_recording`
-    is called, then transcribes using the provided `Transcriber`.
+    is called and transcribes using the provided `Transcriber`. When both
+    support it, captured audio is fed to the transcriber's streaming API
+    while recording so only the tail remains to decode after stop, and the
+    running transcript is emitted as `transcription_partial`.
     All interactions with the UI should be done via `signals`.
     """
 
@@ -27,9 +32,15 @@ class RecordingWorker(QThread):
         super().__init__()
         self.transcriber = transcriber
         self.recorder = AudioRecorder()
-        self._should_stop: bool = False
-        self._mutex = QMutex()
+        # Set by stop_recording(); wakes the run loop immediately
+        self._stop_event = threading.Event()
         self._audio_data: Optional[np.ndarray] = None
+        # Samples already pushed to transcriber.feed_chunk during recording
+        self._samples_fed: int = 0
+        # True while an external PCM stream (process_pcm_chunk) is open
+        self._pcm_streaming: bool = False
+        # Set when a streamed block failed; later blocks are dropped
+        self._pcm_stream_failed: bool = False
 
     def run(self) -> None:
         """Record audio until stopped, then transcribe.
@@ -37,24 +48,26 @@ class RecordingWorker(QThread):
         Emits recording and transcription signals. Catches errors and emits
         `transcription_error` instead of raising.
         """
+        streaming = False
         try:
             signals.recording_started.emit()
-            signals.status_update.emit("Recording...")
 
             self.recorder.start()
+            streaming = hasattr(self.recorder, "read_new_samples") and hasattr(
+                self.transcriber, "feed_chunk"
+            )
+            self._samples_fed = 0
 
-            # Poll until stop requested
-            while True:
-                self._mutex.lock()
-                should_stop = self._should_stop
-                self._mutex.unlock()
-                if should_stop:
-                    break
-                # Qt-friendly sleep
-                self.msleep(50)
-
-            # Stop recording and collect audio
-            audio = self.recorder.stop()
+            try:
+                if streaming:
+                    # Decode captured audio every 50 ms until stop is requested
+                    while not self._stop_event.wait(0.05):
+                        self._feed_samples(self.recorder.read_new_samples())
+                else:
+                    self._stop_event.wait()
+            finally:
+                # Stop recording and collect audio, even if decoding failed
+                audio = self.recorder.stop()
             self._audio_data = audio
             signals.recording_stopped.emit()
 
@@ -64,99 +77,218 @@ class RecordingWorker(QThread):
 
             # Transcribe
             signals.transcription_started.emit()
-            signals.status_update.emit("Processing...")
 
-            text = self.transcriber.transcribe(self._audio_data)
+            if streaming:
+                # Only the samples captured since the last poll are left
+                self._feed_samples(self._audio_data[self._samples_fed :])
+                text = self.transcriber.finalize()
+            else:
+                text = self.transcriber.transcribe(self._audio_data)
             signals.transcription_complete.emit(text)
-            signals.status_update.emit("Ready")
 
         except AudioRecorderError as e:
+            self._abort_stream(streaming)
             signals.transcription_error.emit(f"Recording error: {e}")
         except TranscriberError as e:
+            self._abort_stream(streaming)
             signals.transcription_error.emit(f"Transcription error: {e}")
         except Exception as e:
+            self._abort_stream(streaming)
             signals.transcription_error.emit(f"Unexpected error: {e}")
 
+    def _abort_stream(self, streaming: bool) -> None:
+        """Drop a half-fed recognizer stream so the next take starts clean."""
+        if streaming:
+            self.transcriber.reset_stream()
+
     def stop_recording(self) -> None:
         """Signal the worker to stop recording (thread-safe).
 
-        This method sets a flag protected by a QMutex which the running
-        thread polls and reacts to.
+        Sets an event the running thread waits on, so it wakes immediately.
         """
-        self._mutex.lock()
-        try:
-            self._should_stop = True
-        finally:
-            self._mutex.unlock()
+        self._stop_event.set()
 
     def reset(self) -> None:
-        """Reset worker state for reuse."""
-        self._mutex.lock()
-        try:
-            self._should_stop = False
-            self._audio_data = None
-        finally:
-            self._mutex.unlock()
+        """Reset worker state so the finished thread can be started again."""
+        self._stop_event.clear()
+        self._audio_data = None
 
-    def process_pcm(self, pcm_bytes: bytes) -> None:
+    def process_pcm(self, pcm: Union[bytes, bytearray, memoryview, array]) -> None:
         """Process externally provided PCM bytes through the Transcriber.
 
         This allows piping audio into the running worker (e.g., from a FIFO or
         external tool) without using the microphone stack. Emits the same
         transcription signals as the regular recording flow.
+
+        `pcm` may be any buffer-protocol object holding int16 samples (e.g.
+        bytes, bytearray, memoryview or array.array); it is viewed as raw
+        bytes and handed to the transcriber without copying.
         """
         try:
-            if not pcm_bytes:
+            mv = memoryview(pcm).cast("B")
+            if mv.nbytes == 0:
                 signals.transcription_error.emit("No audio provided")
                 return
+            if mv.nbytes % 2:
+                signals.transcription_error.emit(
+                    "PCM payload is not a whole number of int16 samples"
+                )
+                return
 
             signals.transcription_started.emit()
-            signals.status_update.emit("Processing...")
 
-            # Prefer feed_pcm injection API if available
-            if hasattr(self.transcriber, "feed_pcm"):
-                text = self.transcriber.feed_pcm(pcm_bytes)
-            else:
-                # Fallback: convert bytes to numpy array and call transcribe
-                arr = np.frombuffer(pcm_bytes, dtype=np.int16)
-                text = self.transcriber.transcribe(arr)
+            # int16 is Vosk's native input; feed_pcm views it without converting
+            text = self.transcriber.feed_pcm(mv)
+
+            signals.transcription_complete.emit(text)
+        except TranscriberError as e:
+            signals.transcription_error.emit(f"Transcription error: {e}")
+        except Exception as e:
+            signals.transcription_error.emit(f"Unexpected error: {e}")
+
+    def _feed_samples(self, samples: np.ndarray) -> None:
+        """Push captured int16 samples to the transcriber's streaming API.
+
+        The running transcript is published via `transcription_partial`.
+        """
+        if samples.size:
+            self.transcriber.feed_chunk(
+                samples.tobytes(), on_partial=signals.transcription_partial.emit
+            )
+            self._samples_fed += samples.size
+
+    def process_pcm_chunk(self, pcm_chunk: bytes) -> None:
+        """Decode one block of a streamed PCM payload as it arrives.
+
+        The first block emits `transcription_started`; `finish_pcm_stream`
+        emits the result once the stream ends.
+        """
+        if self._pcm_stream_failed:
+            return
+        try:
+            if not self._pcm_streaming:
+                self._pcm_streaming = True
+                signals.transcription_started.emit()
+            self.transcriber.feed_chunk(pcm_chunk)
+        except TranscriberError as e:
+            self._pcm_stream_failed = True
+            signals.transcription_error.emit(f"Transcription error: {e}")
+        except Exception as e:
+            self._pcm_stream_failed = True
+            signals.transcription_error.emit(f"Unexpected error: {e}")
 
+    def finish_pcm_stream(self) -> None:
+        """Finalize the stream fed through `process_pcm_chunk` and emit its text."""
+        failed = self._pcm_stream_failed
+        self._pcm_stream_failed = False
+        if failed:
+            # The error was already reported; just close the recognizer stream
+            self._pcm_streaming = False
+            try:
+                self.transcriber.finalize()
+            except Exception:
+                pass
+            return
+        if not self._pcm_streaming:
+            signals.transcription_error.emit("No audio provided")
+            return
+        self._pcm_streaming = False
+        try:
+            text = self.transcriber.finalize()
             signals.transcription_complete.emit(text)
-            signals.status_update.emit("Ready")
         except TranscriberError as e:
             signals.transcription_error.emit(f"Transcription error: {e}")
         except Exception as e:
             signals.transcription_error.emit(f"Unexpected error: {e}")
 
 
-class TranslationWorker(QThread):
-    """Worker thread to perform text translation in background.
+class TranslationWorker(QRunnable):
+    """Task that performs one text translation in the background.
 
-    Emits translation-related signals via `signals`.
+    Submit with `QThreadPool.globalInstance().start(worker)` so pooled
+    threads are reused across translations, or through `TranslationDispatcher`
+    to keep only the latest request in flight. Emits translation-related
+    signals via `signals`.
     """
 
     def __init__(
-        self, translator: Translator, text: str, target_language: str = "English"
+        self,
+        translator: Translator,
+        text: str,
+        target_language: str = "English",
+        on_finished: Optional[Callable[[], bool]] = None,
     ) -> None:
         super().__init__()
+        # The pool owns and deletes the task once run() returns
+        self.setAutoDelete(True)
         self.translator = translator
         self.text = text
         self.target_language = target_language
+        # Called once the translation ends; True means a newer request
+        # superseded this one and its result is dropped
+        self.on_finished = on_finished
 
     def run(self) -> None:
         try:
             signals.translation_started.emit()
-            signals.status_update.emit("Translating...")
 
             try:
                 result = self.translator.translate(self.text, self.target_language)
-                signals.translation_complete.emit(result)
-                signals.status_update.emit("Ready")
+                emit, payload = signals.translation_complete.emit, result
             except TranslatorError as e:
-                signals.translation_error.emit(str(e))
+                emit, payload = signals.translation_error.emit, str(e)
             except Exception as e:
-                signals.translation_error.emit(f"Unexpected error: {e}")
+                emit, payload = signals.translation_error.emit, f"Unexpected error: {e}"
+
+            if self.on_finished is not None and self.on_finished():
+                return
+            emit(payload)
 
         except Exception as e:
             # Top-level guard: ensure any uncaught error is reported
             signals.translation_error.emit(f"Worker failure: {e}")
+
+
+class TranslationDispatcher:
+    """Runs at most one translation at a time, keeping only the latest request.
+
+    Requests made while a translation is in flight replace any earlier
+    pending one. When the running translation ends and a newer request is
+    pending, its result is dropped and the pending request starts, so the
+    emitted translation always matches the most recent request.
+    """
+
+    def __init__(
+        self, translator: Translator, pool: Optional[QThreadPool] = None
+    ) -> None:
+        self.translator = translator
+        self._pool = pool or QThreadPool.globalInstance()
+        self._lock = threading.Lock()
+        self._running = False
+        self._pending: Optional[Tuple[str, str]] = None
+
+    def request(self, text: str, target_language: str = "English") -> None:
+        """Translate `text`, superseding any request still waiting to run."""
+        with self._lock:
+            if self._running:
+                self._pending = (text, target_language)
+                return
+            self._running = True
+        self._start(text, target_language)
+
+    def _start(self, text: str, target_language: str) -> None:
+        self._pool.start(
+            TranslationWorker(
+                self.translator, text, target_language, on_finished=self._finish
+            )
+        )
+
+    def _finish(self) -> bool:
+        """Start the pending request, if any; True when one superseded the run."""
+        with self._lock:
+            pending, self._pending = self._pending, None
+            if pending is None:
+                self._running = False
+                return False
+        self._start(*pending)
+        return True
@@ -4,28 +4,23 @@ Launch the Qt GUI by default. If the GUI cannot start (missing PySide6 or
 running in a headless environment), fall back to a minimal text message.
 """
 
-import builtins
-import os
+import threading
 
-# Lightweight debug print wrapper: preserve original print but also persist
-# lines that begin with [DBG to a per-user temporary log for later inspection.
-_orig_print = builtins.print
-_log_path = os.path.expanduser("~/.voice_translator_debug.log")
+from src.utils.debug_log import dbg, setup_debug_log
 
-def _dbg_print(*args, **kwargs):
-    _orig_print(*args, **kwargs)
-    try:
-        sep = kwargs.get("sep", " ")
-        end = kwargs.get("end", "\n")
-        msg = sep.join(str(a) for a in args) + end
-        if msg.startswith("[DBG"):
-            with open(_log_path, "a", encoding="utf-8") as f:
-                f.write(msg)
-    except Exception:
-        # Never let logging break the app
-        pass
 
-builtins.print = _dbg_print
+def _preload_model_in_background() -> None:
+    """Warm the shared Vosk model cache so the first recording starts quickly."""
+    from src.core.transcriber import TranscriberError, preload_model
+
+    def _run():
+        try:
+            preload_model()
+        except TranscriberError as e:
+            # Reported again by the UI when recording starts
+            dbg("main: model preload failed: %s", e)
+
+    threading.Thread(target=_run, name="model-preload", daemon=True).start()
 
 
 def main() -> None:
@@ -36,7 +31,9 @@ def main() -> None:
         # Import GUI after confirming PySide6 is available
         from src.ui.main_window import FloatingWidget
 
+        setup_debug_log()
         app = QApplication.instance() or QApplication(sys.argv)
+        _preload_model_in_background()
 
         # Install a Qt message handler to capture stack traces for problematic
         # platform plugin warnings (e.g., 'This plugin does not support raise()').
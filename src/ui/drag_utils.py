@@ -1,66 +1,108 @@
-from typing import Union, cast
-from PySide6.QtCore import QPoint, QPointF
+from typing import Optional
+from PySide6.QtCore import QPoint, Qt, QTimer
 from PySide6.QtGui import QGuiApplication
 from PySide6.QtWidgets import QWidget
 
+# Minimum interval between drag moves (~one 60 Hz frame)
+MOVE_INTERVAL_MS = 16
+
+# Lower-cased QPA platform name, resolved once the application exists
+_platform_name: Optional[str] = None
+
+
+def platform_name() -> str:
+    """Return the lower-cased Qt platform plugin name (e.g. "wayland", "xcb").
+
+    The name can't change for the lifetime of the application, so it is
+    looked up once. Returns "" before a QGuiApplication exists.
+    """
+    global _platform_name
+    if _platform_name is None:
+        name = QGuiApplication.platformName()
+        if not name:
+            return ""
+        _platform_name = name.lower()
+    return _platform_name
+
 
 class DraggableWidget(QWidget):
     """Minimal helper to centralize drag/position persistence and Wayland move."""
 
+    # Bound once; compared on every mouse event of a drag
+    _LEFT_BUTTON = Qt.MouseButton.LeftButton
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._drag_position = QPoint()
         self._saved_pos = None
         self._saved_size = None
+        # Latest drag target; applied at most once per MOVE_INTERVAL_MS
+        self._pending_pos: Optional[QPoint] = None
+        self._move_scheduled = False
+        # True while the compositor drives the current drag (startSystemMove)
+        self._system_moving = False
 
-    def _get_drag_offset(self, global_pos: Union[QPoint, QPointF]) -> QPoint:
+    def _get_drag_offset(self, global_pos: QPoint) -> QPoint:
         """Calculate drag offset from global mouse position.
-        
+
         Args:
-            global_pos: Global mouse position as QPoint or QPointF
-            
+            global_pos: Global mouse position; callers convert the event's
+                        QPointF once with toPoint()
+
         Returns:
             QPoint offset between global position and window position
         """
-        try:
-            if isinstance(global_pos, QPointF):
-                return global_pos.toPoint() - self.pos()
-            else:
-                # Treat global_pos as QPoint here; cast for the type checker
-                return cast(QPoint, global_pos) - self.pos()
-        except Exception:
-            # Fallback for edge cases
-            return self.pos() - self.frameGeometry().topLeft()
+        return global_pos - self.pos()
+
+    def _schedule_move(self, pos: QPoint) -> None:
+        """Move to `pos` within `MOVE_INTERVAL_MS`.
+
+        Mouse-move events arriving faster than the display refreshes
+        collapse into a single `move()` to the latest position. Call
+        `_flush_move()` on release to land on the final position at once.
+        """
+        self._pending_pos = pos
+        if not self._move_scheduled:
+            self._move_scheduled = True
+            QTimer.singleShot(MOVE_INTERVAL_MS, self._flush_move)
+
+    def _flush_move(self) -> None:
+        """Apply the pending drag position, if any and not already there."""
+        self._move_scheduled = False
+        pos, self._pending_pos = self._pending_pos, None
+        if pos is not None and pos != self.pos():
+            self.move(pos)
 
     def _persist_position(self) -> None:
         """Save current position for later restoration."""
-        try:
-            self._saved_pos = self.pos()
-        except Exception:
-            self._saved_pos = None
+        self._saved_pos = self.pos()
 
     def _restore_position(self) -> None:
         """Restore saved position if available."""
-        from PySide6.QtCore import QPoint
         pos = getattr(self, "_saved_pos", None)
         if isinstance(pos, QPoint):
-            try:
-                self.move(pos)
-            except Exception:
-                pass
+            self.move(pos)
+
+    def _request_system_move(self, any_platform: bool = False) -> bool:
+        """Hand the current drag to the compositor via startSystemMove.
+
+        Wayland only allows compositor-managed moves, so it is always tried
+        there. Elsewhere it is only tried with `any_platform`: on X11 and
+        Windows the system move takes the pointer grab, so a child button
+        pressed to start the drag would never see its release.
 
-    def _request_system_move(self) -> bool:
-        """Request Wayland compositor-managed move if available.
-        
         Returns:
-            True if startSystemMove was called, False otherwise.
+            True if the compositor accepted the move; manual `move()` calls
+            are then skipped until the next press.
         """
-        try:
-            if QGuiApplication.platformName().lower().startswith("wayland"):
+        self._system_moving = False
+        name = platform_name()
+        if name != "offscreen" and (any_platform or name.startswith("wayland")):
+            try:
                 wh = self.window().windowHandle()
                 if wh is not None:
-                    wh.startSystemMove()
-                    return True
-        except Exception:
-            pass
-        return False
+                    self._system_moving = bool(wh.startSystemMove())
+            except Exception:
+                # Older Qt or a platform plugin without support; move manually
+                self._system_moving = False
+        return self._system_moving
@@ -1,10 +1,13 @@
 """Floating record button for Background Mode."""
 
-import logging
-from PySide6.QtWidgets import QPushButton, QVBoxLayout, QApplication
-from PySide6.QtCore import Qt, Signal, QObject, QEvent, QPointF
-from PySide6.QtGui import QMouseEvent
+from typing import Optional
+
+from PySide6.QtWidgets import QPushButton, QApplication
+from PySide6.QtCore import Qt, Signal, Slot, QObject, QEvent, QRect
+from PySide6.QtGui import QMouseEvent, QScreen
 from .drag_utils import DraggableWidget
+from .styles import FLOATING_BUTTON
+from src.utils.debug_log import dbg
 
 
 class FloatingRecordButton(DraggableWidget):
@@ -18,11 +21,42 @@ class FloatingRecordButton(DraggableWidget):
     # Emitted when user double-clicks the floating widget to restore main window
     show_requested = Signal()
 
+    # Event types forwarded by eventFilter, bound once
+    _MOUSE_PRESS = QEvent.Type.MouseButtonPress
+    _MOUSE_RELEASE = QEvent.Type.MouseButtonRelease
+    _MOUSE_MOVE = QEvent.Type.MouseMove
+    _MOUSE_EVENTS = frozenset((_MOUSE_PRESS, _MOUSE_RELEASE, _MOUSE_MOVE))
+
     def __init__(self):
         super().__init__()
+        # Primary screen's available geometry, kept current via its signals
+        self._primary_screen: Optional[QScreen] = None
+        self._primary_geom = QRect()
+        self._watch_primary_screen(QApplication.primaryScreen())
+        QApplication.instance().primaryScreenChanged.connect(
+            self._watch_primary_screen
+        )
         self._setup_window()
         self._setup_ui()
 
+    def _watch_primary_screen(self, screen: Optional[QScreen]) -> None:
+        """Cache `screen`'s available geometry and follow its changes."""
+        if self._primary_screen is not None:
+            try:
+                self._primary_screen.availableGeometryChanged.disconnect(
+                    self._set_primary_geom
+                )
+            except RuntimeError:
+                # The previous primary screen was already removed
+                pass
+        self._primary_screen = screen
+        if screen is not None:
+            self._primary_geom = screen.availableGeometry()
+            screen.availableGeometryChanged.connect(self._set_primary_geom)
+
+    def _set_primary_geom(self, geom: QRect) -> None:
+        self._primary_geom = geom
+
     def _setup_window(self):
         """Configure window properties."""
         # Use explicit WindowType to satisfy static type checkers
@@ -37,76 +71,47 @@ class FloatingRecordButton(DraggableWidget):
 
     def _setup_ui(self):
         """Set up the button UI."""
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
+        # One sheet on the container styles both children by object name
+        self.setStyleSheet(FLOATING_BUTTON)
 
+        # A single fixed-size child needs no layout; place it directly
         self.button = QPushButton("⏺", self)
+        self.button.setObjectName("floatingRecordButton")
         self.button.setFixedSize(60, 60)
+        self.button.move(0, 5)
         self.button.setCheckable(True)
-        self.button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: rgba(220, 53, 69, 0.9);
-                border-radius: 30px;
-                border: 2px solid #dc3545;
-                color: white;
-                font-size: 24px;
-            }
-            QPushButton:hover {
-                background-color: rgba(220, 53, 69, 1.0);
-            }
-            QPushButton:checked {
-                background-color: rgba(220, 53, 69, 1.0);
-                border: 3px solid white;
-            }
-            """
-        )
         self.button.toggled.connect(self._on_toggled)
-        layout.addWidget(self.button)
         # Install event filter so clicks/drags on the child button are also
         # observed by the floating widget (allowing dragging when clicking the icon).
-        try:
-            self.button.installEventFilter(self)
-        except Exception:
-            pass
+        self.button.installEventFilter(self)
 
-        # Add a small '+' button to restore the main window (replaces double-click)
-        self.restore_button = QPushButton("+", self)
-        self.restore_button.setFixedSize(22, 22)
-        self.restore_button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: rgba(0,0,0,0.4);
-                color: white;
-                border-radius: 11px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: rgba(0,0,0,0.6);
-            }
-            """
-        )
-        self.restore_button.clicked.connect(lambda: self.show_requested.emit())
-        # Position in top-right corner of the floating widget
-        self._position_restore_button()
-        # raise() may be unsupported on some QPA platforms (offscreen).
-        try:
-            from PySide6.QtGui import QGuiApplication
+        # The '+' restore button is built on first show (see restore_button)
+        self._restore_button: Optional[QPushButton] = None
 
-            if QGuiApplication.platformName() != "offscreen":
-                self.restore_button.raise_()
-        except Exception:
-            # If platformName is unavailable or raise_() fails, silently continue
-            pass
-
-        # Install event filter on restore button as well so dragging works when
-        # user clicks near the restore control.
-        try:
-            self.restore_button.installEventFilter(self)
-        except Exception:
-            pass
+    @property
+    def restore_button(self) -> QPushButton:
+        """Small '+' button that restores the main window (replaces double-click).
 
+        Created on first access so constructing the floating widget, which
+        may never be shown, skips its stylesheet and event-filter setup.
+        """
+        if self._restore_button is None:
+            button = QPushButton("+", self)
+            button.setFixedSize(22, 22)
+            button.setObjectName("floatingRestoreButton")
+            button.clicked.connect(self.show_requested)
+            # Install event filter on restore button as well so dragging works
+            # when user clicks near the restore control.
+            button.installEventFilter(self)
+            self._restore_button = button
+            # Position in top-right corner of the floating widget
+            self._position_restore_button()
+            # Children added after the parent is shown need an explicit show();
+            # created last, it already stacks above the record button
+            button.show()
+        return self._restore_button
 
+    @Slot(bool)
     def _on_toggled(self, checked: bool):
         """Handle button toggle and emit signal."""
         if checked:
@@ -119,82 +124,60 @@ class FloatingRecordButton(DraggableWidget):
         """Set the recording state externally."""
         self.button.setChecked(recording)
 
-    # Dragging support
-    def _to_qpoint(self, global_pos):
-        """Normalize a global position (QPointF or QPoint) to QPoint."""
-        try:
-            if isinstance(global_pos, QPointF):
-                return global_pos.toPoint()
-        except Exception:
-            pass
-        return global_pos
-
     def _position_restore_button(self):
-        try:
-            self.restore_button.move(self.width() - 24, 4)
-        except Exception:
-            pass
+        if self._restore_button is not None:
+            self._restore_button.move(self.width() - 24, 4)
 
     def mousePressEvent(self, event: QMouseEvent):
-        if event.button() == Qt.MouseButton.LeftButton:
-            gp = self._to_qpoint(event.globalPosition())
+        if event.button() == self._LEFT_BUTTON:
+            gp = event.globalPosition().toPoint()
             # Use DraggableWidget helper for consistent offset calculation
-            self._drag_position = self._get_drag_offset(event.globalPosition())
-            logging.debug(f"[DBG floating_button] mousePress gp={gp} drag_offset={self._drag_position}")
+            self._drag_position = self._get_drag_offset(gp)
+            dbg("floating_button: mousePress gp=%s drag_offset=%s", gp, self._drag_position)
             # Request Wayland-managed move if supported
             self._request_system_move()
             event.accept()
 
     def mouseMoveEvent(self, event: QMouseEvent):
-        if event.buttons() & Qt.MouseButton.LeftButton:
-            gp = self._to_qpoint(event.globalPosition())
-            new_pos = gp - self._drag_position
-            self.move(new_pos)
-            logging.debug(f"[DBG floating_button] mouseMove moved_to={new_pos}")
-            # Persist position via DraggableWidget helper
-            try:
-                self._persist_position()
-            except Exception:
-                pass
+        if event.buttons() & self._LEFT_BUTTON:
+            # The compositor moves the window itself during a system move
+            if not self._system_moving:
+                new_pos = event.globalPosition().toPoint() - self._drag_position
+                self._schedule_move(new_pos)
             event.accept()
 
+    def mouseReleaseEvent(self, event: QMouseEvent):
+        if event.button() == self._LEFT_BUTTON:
+            # Land on the final drag position, then persist it once
+            self._flush_move()
+            self._persist_position()
+        super().mouseReleaseEvent(event)
+
     def eventFilter(self, watched: QObject, event: QEvent) -> bool:
         """Forward mouse events from child widgets to the floating widget handlers.
 
         This allows dragging the floating button even when the user clicks on the
         visible child QPushButton(s). Keep returning False when forwarding so
         the child still receives the event (preserves toggle behavior).
+        Paint, hover and focus events are rejected with one set lookup; of
+        the forwarded types, moves are tested first as they dominate a drag.
         """
-        if isinstance(event, QMouseEvent):
-            try:
-                et = event.type()
-                if et == QEvent.Type.MouseButtonPress:
-                    try:
-                        self.mousePressEvent(event)
-                    except Exception:
-                        pass
-                elif et == QEvent.Type.MouseButtonRelease:
-                    try:
-                        self.mouseReleaseEvent(event)
-                    except Exception:
-                        pass
-                elif et == QEvent.Type.MouseMove:
-                    try:
-                        self.mouseMoveEvent(event)
-                    except Exception:
-                        pass
-            except Exception:
-                pass
+        et = event.type()
+        if et not in self._MOUSE_EVENTS:
             return False
-
-        return super().eventFilter(watched, event)
+        if et == self._MOUSE_MOVE:
+            self.mouseMoveEvent(event)
+        elif et == self._MOUSE_PRESS:
+            self.mousePressEvent(event)
+        elif et == self._MOUSE_RELEASE:
+            self.mouseReleaseEvent(event)
+        return False
 
     def position_bottom_right(self):
         """Position button at bottom-right of primary screen with 20px margin."""
-        screen = QApplication.primaryScreen().availableGeometry()
-        x = screen.width() - 90
-        y = screen.height() - 90
-        logging.debug(f"[DBG floating_button] position_bottom_right -> x={x} y={y}")
+        x = self._primary_geom.width() - 90
+        y = self._primary_geom.height() - 90
+        dbg("floating_button: position_bottom_right -> x=%s y=%s", x, y)
         self.move(x, y)
 
     def resizeEvent(self, event):
@@ -205,16 +188,18 @@ class FloatingRecordButton(DraggableWidget):
     def showEvent(self, event):
         """Ensure restore button is correctly positioned when shown and restore saved position."""
         try:
+            # First access builds the button; later shows just reposition it
+            self.restore_button
             self._position_restore_button()
             saved_pos = getattr(self, "_saved_pos", None)
             if saved_pos is not None:
-                logging.debug(f"[DBG floating_button] showEvent restoring saved_pos={saved_pos}")
+                dbg("floating_button: showEvent restoring saved_pos=%s", saved_pos)
                 try:
                     self._restore_position()
                 except Exception:
                     pass
             else:
-                logging.debug("[DBG floating_button] showEvent no saved_pos, positioning bottom-right")
+                dbg("floating_button: showEvent no saved_pos, positioning bottom-right")
                 self.position_bottom_right()
         except Exception:
             pass
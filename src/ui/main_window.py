@@ -1,4 +1,4 @@
-from typing import Optional, cast
+from typing import Any, Optional, cast
 
 from PySide6.QtWidgets import (
     QWidget,
@@ -10,8 +10,8 @@ from PySide6.QtWidgets import (
     QComboBox,
     QApplication,
 )
-from PySide6.QtCore import Qt, QTimer, QCoreApplication
-from PySide6.QtGui import QFont, QKeySequence
+from PySide6.QtCore import Qt, QTimer, QCoreApplication, Slot
+from PySide6.QtGui import QFont, QKeySequence, QMouseEvent
 
 # Prefer direct import at runtime; fall back to dynamic lookup to satisfy linters/stubs
 try:
@@ -21,23 +21,43 @@ except Exception:
 
     QShortcut = getattr(_QtWidgets, "QShortcut", None)
 
-from .styles import (
-    DARK_THEME,
-    RECORD_BUTTON_IDLE,
-    RECORD_BUTTON_RECORDING,
-    STATUS_READY,
-    STATUS_RECORDING,
-)
+from .styles import DARK_THEME, STATUS_READY, STATUS_RECORDING
 from .tray_icon import TrayIcon
 from .floating_button import FloatingRecordButton
 
 from src.core.transcriber import Transcriber, TranscriberError
-from src.core.workers import RecordingWorker
+from src.core.workers import RecordingWorker, TranslationDispatcher
 from src.utils.signals import signals
-from .drag_utils import DraggableWidget
+from .drag_utils import DraggableWidget, platform_name
 import logging
+from src.utils.debug_log import dbg
 from src.utils.hotkeys import HotkeyManager
 
+# Target languages offered in the translate combo box
+_LANGUAGES = (
+    "English",
+    "Spanish",
+    "French",
+    "German",
+    "Italian",
+    "Japanese",
+    "Chinese",
+)
+
+
+def _set_style_property(widget: QWidget, name: str, value: Any) -> None:
+    """Set a dynamic property used by stylesheet selectors and repolish.
+
+    Only `widget` is repolished, and only when the value changes, so
+    state changes never re-parse a stylesheet.
+    """
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
 
 class TitleBar(QWidget):
     def __init__(self, parent: QWidget):
@@ -72,33 +92,17 @@ class TitleBar(QWidget):
 
     def mousePressEvent(self, event):
         # TitleBar should forward mouse press events to the parent floating widget
-        from PySide6.QtGui import QMouseEvent
-
         if isinstance(event, QMouseEvent):
-            try:
-                self.parent_window.mousePressEvent(event)
-            except Exception:
-                pass
+            self.parent_window.mousePressEvent(event)
         else:
-            try:
-                super().mousePressEvent(event)
-            except Exception:
-                pass
+            super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event):
         # TitleBar should forward mouse move events to the parent floating widget
-        from PySide6.QtGui import QMouseEvent
-
         if isinstance(event, QMouseEvent):
-            try:
-                self.parent_window.mouseMoveEvent(event)
-            except Exception:
-                pass
+            self.parent_window.mouseMoveEvent(event)
         else:
-            try:
-                super().mouseMoveEvent(event)
-            except Exception:
-                pass
+            super().mouseMoveEvent(event)
 
 
 class FloatingWidget(DraggableWidget):
@@ -108,24 +112,24 @@ class FloatingWidget(DraggableWidget):
         from src.core.translator import Translator
 
         self.translator = Translator()
-        self.translation_worker = None
+        self.translation_dispatcher = TranslationDispatcher(self.translator)
+        # The application-wide clipboard; resolved once for the copy buttons
+        self._clipboard = QApplication.clipboard()
+        # Reverts transient status messages; restarting it coalesces bursts
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.timeout.connect(self._restore_status)
         self._setup_window()
         self._setup_ui()
-        # Tray and floating button (initialized after UI)
-        # Set up tray and floating button independently so one failing doesn't prevent the other.
+        # Tray (initialized after UI). The floating button is only needed once
+        # the app is minimized, so _ensure_floating_button creates it then.
+        self.floating_button: Optional[FloatingRecordButton] = None
         try:
             self._setup_tray()
         except Exception as e:
             import traceback
 
-            print(f"[DBG main_window] _setup_tray failed: {e}")
-            traceback.print_exc()
-        try:
-            self._setup_floating_button()
-        except Exception as e:
-            import traceback
-
-            print(f"[DBG main_window] _setup_floating_button failed: {e}")
+            dbg("main_window: _setup_tray failed: %s", e)
             traceback.print_exc()
         try:
             self._hotkey_manager = HotkeyManager(self)
@@ -146,43 +150,31 @@ class FloatingWidget(DraggableWidget):
         self.setStyleSheet(DARK_THEME)
 
     # --- Small helpers to reduce duplication ---
-    def _write_debug_log(self, msg: str) -> None:
-        try:
-            import os
-
-            log_path = os.path.expanduser("~/.voice_translator_debug.log")
-            with open(log_path, "a", encoding="utf-8") as f:
-                f.write(msg + "\n")
-        except Exception:
-            pass
-
     def _register_local_f8(self) -> None:
         try:
             if QShortcut is None:
                 return
             self._f8_shortcut = QShortcut(QKeySequence("F8"), self)
             # Avoid setContext for static-analysis compatibility
-            self._f8_shortcut.activated.connect(lambda: signals.toggle_recording.emit())
+            self._f8_shortcut.activated.connect(signals.toggle_recording)
             self._f8_shortcut.setEnabled(True)
-            self._write_debug_log(
-                "[DBG main_window] Registered app-focused F8 shortcut"
-            )
-            print("[DBG main_window] Registered app-focused F8 shortcut")
+            dbg("main_window: Registered app-focused F8 shortcut")
         except Exception:
             pass
 
+    def _set_status_state(self, state: str) -> None:
+        """Switch the status label's color via its `state` style property."""
+        _set_style_property(self.status_label, "state", state)
+
     def _set_status(
-        self, text: str, style: Optional[str] = None, timeout_ms: int = 1500
+        self, text: str, state: Optional[str] = None, timeout_ms: int = 1500
     ) -> None:
-        try:
-            self.status_label.setText(text)
-            if style is not None:
-                self.status_label.setStyleSheet(style + " font-size: 14px;")
-            # restore default after timeout
-            if timeout_ms:
-                QTimer.singleShot(timeout_ms, self._restore_status)
-        except Exception:
-            pass
+        self.status_label.setText(text)
+        if state is not None:
+            self._set_status_state(state)
+        # restore default after timeout
+        if timeout_ms:
+            self._status_timer.start(timeout_ms)
 
     def _add_copy_clear_row(
         self, text_edit: QTextEdit, prefix: Optional[str] = None
@@ -215,8 +207,10 @@ class FloatingWidget(DraggableWidget):
                 self._saved_size = self.size()
             except Exception:
                 pass
-            print(
-                f"[DBG main_window] persisted pos={getattr(self, '_saved_pos', None)} size={getattr(self, '_saved_size', None)}"
+            dbg(
+                "main_window: persisted pos=%s size=%s",
+                getattr(self, "_saved_pos", None),
+                getattr(self, "_saved_size", None),
             )
         except Exception:
             pass
@@ -233,7 +227,8 @@ class FloatingWidget(DraggableWidget):
 
         # Status label
         self.status_label = QLabel("✅ Ready - Press F8 to record", self)
-        self.status_label.setStyleSheet(STATUS_READY + " font-size: 14px;")
+        self.status_label.setObjectName("statusLabel")
+        self._set_status_state(STATUS_READY)
         self.main_layout.addWidget(self.status_label)
 
         # --- Portuguese section ---
@@ -253,16 +248,7 @@ class FloatingWidget(DraggableWidget):
         lang_row = QHBoxLayout()
         lang_row.addWidget(QLabel("Translate to:", self))
         self.language_combo = QComboBox(self)
-        languages = [
-            "English",
-            "Spanish",
-            "French",
-            "German",
-            "Italian",
-            "Japanese",
-            "Chinese",
-        ]
-        self.language_combo.addItems(languages)
+        self.language_combo.addItems(_LANGUAGES)
         lang_row.addWidget(self.language_combo)
 
         self.translate_btn = QPushButton("🔄 Translate", self)
@@ -291,7 +277,7 @@ class FloatingWidget(DraggableWidget):
             signals.translation_complete.connect(self._on_translation_complete)
             signals.translation_error.connect(self._on_translation_error)
         except Exception as e:
-            print(f"[DBG main_window] Failed to connect translation signals: {e}")
+            dbg("main_window: Failed to connect translation signals: %s", e)
 
         # --- Record button ---
         record_row = QHBoxLayout()
@@ -299,7 +285,7 @@ class FloatingWidget(DraggableWidget):
         self.record_button = QPushButton("⏺ REC", self)
         self.record_button.setCheckable(True)
         self.record_button.setFixedSize(80, 80)
-        self.record_button.setStyleSheet(RECORD_BUTTON_IDLE)
+        self.record_button.setObjectName("recordButton")
         font = QFont()
         font.setPointSize(12)
         font.setBold(True)
@@ -312,9 +298,15 @@ class FloatingWidget(DraggableWidget):
         # Transcriber and worker (initialized when recording starts)
         self.transcriber: Optional[Transcriber] = None
         self.worker: Optional[RecordingWorker] = None
+        # Set when REC is pressed while the previous take is still decoding
+        self._start_pending = False
 
         # Connect global signals to UI handlers
         try:
+            signals.transcription_started.connect(
+                lambda: self.status_label.setText("⏳ Processing...")
+            )
+            signals.transcription_partial.connect(self._on_transcription_partial)
             signals.transcription_complete.connect(self._on_transcription_complete)
             signals.transcription_error.connect(self._on_transcription_error)
             signals.recording_started.connect(
@@ -323,10 +315,10 @@ class FloatingWidget(DraggableWidget):
             signals.recording_stopped.connect(
                 lambda: self.status_label.setText("✅ Ready - Press F8 to record")
             )
-            signals.status_update.connect(lambda s: self.status_label.setText(s))
+            signals.status_update.connect(self.status_label.setText)
             # Allow external toggles (e.g. global hotkey) to toggle the record button safely
             try:
-                signals.toggle_recording.connect(lambda: self.record_button.toggle())
+                signals.toggle_recording.connect(self.record_button.toggle)
             except Exception:
                 pass
             # Also register an application-scoped F8 shortcut (focused window only)
@@ -337,37 +329,30 @@ class FloatingWidget(DraggableWidget):
         except Exception:
             pass
 
+    @Slot()
     def _on_translate_clicked(self):
-        from src.core.workers import TranslationWorker
-
         # use top-level `signals` imported earlier
         text = self.portuguese_text.toPlainText()
         target_language = self.language_combo.currentText()
-        # Avoid multiple concurrent workers
-        worker = getattr(self, "translation_worker", None)
-        if worker is not None:
-            try:
-                worker.quit()
-            except Exception:
-                pass
-        self.translation_worker = TranslationWorker(
-            self.translator, text, target_language
-        )
-        self.translation_worker.start()
+        # Rapid re-clicks collapse to the latest text; stale results are dropped
+        self.translation_dispatcher.request(text, target_language)
 
+    @Slot()
     def _on_translation_started(self):
         self.status_label.setText("🔄 Translating...")
-        self.status_label.setStyleSheet(STATUS_RECORDING + " font-size: 14px;")
+        self._set_status_state(STATUS_RECORDING)
         self.translation_text.setPlainText("")
 
+    @Slot(str)
     def _on_translation_complete(self, translated_text):
         self.translation_text.setPlainText(translated_text)
         self.status_label.setText("✅ Translation complete")
-        self.status_label.setStyleSheet(STATUS_READY + " font-size: 14px;")
+        self._set_status_state(STATUS_READY)
 
+    @Slot(str)
     def _on_translation_error(self, error_msg):
         self.status_label.setText(f"❌ Translation error: {error_msg}")
-        self.status_label.setStyleSheet(STATUS_READY + " font-size: 14px;")
+        self._set_status_state(STATUS_READY)
 
     # --- Tray & Floating Button integration ---
     def _setup_tray(self):
@@ -377,17 +362,17 @@ class FloatingWidget(DraggableWidget):
         self.tray.quit_requested.connect(self._quit_app)
         self.tray.show()
 
-    def _setup_floating_button(self):
-        """Create floating record button used when app is minimized."""
-        self.floating_button = FloatingRecordButton()
-        self.floating_button.toggled.connect(self._on_floating_button_toggled)
-        try:
-            self.floating_button.show_requested.connect(self._show_window)
-        except Exception:
-            pass
-        # Do not force a position here; the floating button will restore its
-        # last saved position when shown. Initially keep it hidden.
-        self.floating_button.hide()
+    def _ensure_floating_button(self) -> FloatingRecordButton:
+        """Return the floating record button, creating it on first use."""
+        if self.floating_button is None:
+            floating_button = FloatingRecordButton()
+            floating_button.toggled.connect(self._on_floating_button_toggled)
+            floating_button.show_requested.connect(self._show_window)
+            # Do not force a position here; the floating button will restore
+            # its last saved position when shown. Initially keep it hidden.
+            floating_button.hide()
+            self.floating_button = floating_button
+        return self.floating_button
 
     def _setup_global_hotkey(self):
         """Register a global F8 hotkey that toggles recording via signals.toggle_recording.
@@ -416,48 +401,29 @@ class FloatingWidget(DraggableWidget):
         except Exception as e:
             logging.exception(f"_setup_global_hotkey failed: {e}")
 
+    @Slot()
     def _show_window(self):
         """Show and focus the main window; hide floating button."""
         self.show()
         # Some QPA platforms (e.g. offscreen) don't support raise(); avoid
         # calling it on those platforms to prevent noisy warnings.
-        try:
-            from PySide6.QtGui import QGuiApplication
-
-            if QGuiApplication.platformName() != "offscreen":
-                try:
-                    self.raise_()
-                except Exception:
-                    pass
-        except Exception:
-            # If platformName check fails, ignore and continue
-            pass
-        # Try to activate the window, but ignore if unsupported
-        try:
-            self.activateWindow()
-        except Exception:
-            pass
-        print(
-            f"[DBG main_window] _show_window: saved_pos={getattr(self, '_saved_pos', None)} saved_size={getattr(self, '_saved_size', None)}"
+        if platform_name() != "offscreen":
+            self.raise_()
+        self.activateWindow()
+        dbg(
+            "main_window: _show_window: saved_pos=%s saved_size=%s",
+            self._saved_pos,
+            self._saved_size,
         )
         # Restore previous position/size if available
-        try:
-            saved_pos = getattr(self, "_saved_pos", None)
-            if saved_pos is not None:
-                self.move(saved_pos)
-            saved_size = getattr(self, "_saved_size", None)
-            if saved_size is not None:
-                try:
-                    self.resize(saved_size)
-                except Exception:
-                    pass
-        except Exception:
-            pass
-        try:
+        if self._saved_pos is not None:
+            self.move(self._saved_pos)
+        if self._saved_size is not None:
+            self.resize(self._saved_size)
+        if self.floating_button is not None:
             self.floating_button.hide()
-        except Exception:
-            pass
 
+    @Slot()
     def _quit_app(self):
         """Quit the application."""
         # Clean up global hotkey if registered via HotkeyManager
@@ -469,6 +435,10 @@ class FloatingWidget(DraggableWidget):
                     pass
         except Exception:
             pass
+        try:
+            self.translator.close()
+        except Exception:
+            pass
         # Use QCoreApplication.instance() to quit safely without assuming global QApplication
         try:
             app = QCoreApplication.instance()
@@ -482,61 +452,40 @@ class FloatingWidget(DraggableWidget):
         except Exception:
             # Last resort: attempt to call QApplication.quit() if available
             try:
-                from PySide6.QtWidgets import QApplication
-
                 QApplication.quit()
             except Exception:
                 pass
 
+    @Slot()
     def _minimize_to_floating(self):
         """Minimize the app into the floating button instead of normal minimize.
 
         Save current geometry so it can be restored when reopening the window.
         """
         # Save position/size to restore later
-        try:
-            self._saved_pos = self.pos()
-            self._saved_size = self.size()
-        except Exception:
-            self._saved_pos = None
-            self._saved_size = None
-        print(
-            f"[DBG main_window] _minimize_to_floating: saved_pos={getattr(self,'_saved_pos',None)} saved_size={getattr(self,'_saved_size',None)}"
+        self._saved_pos = self.pos()
+        self._saved_size = self.size()
+        dbg(
+            "main_window: _minimize_to_floating: saved_pos=%s saved_size=%s",
+            self._saved_pos,
+            self._saved_size,
         )
         # Hide main window and show floating button + tray notification
-        print(
-            f"[DBG main_window] _minimize_to_floating: has_floating_button={hasattr(self, 'floating_button')} floating_button_obj={getattr(self, 'floating_button', None)}"
-        )
         self.hide()
-        print(
-            "[DBG main_window] main window hidden, attempting to show floating_button"
-        )
+        dbg("main_window: main window hidden, attempting to show floating_button")
         try:
+            floating_button = self._ensure_floating_button()
             # If the floating button was moved by the user previously, restore
             # that position; otherwise, position it at bottom-right.
-            if getattr(self, "floating_button", None) is None:
-                print(
-                    "[DBG main_window] no floating_button attribute - skipping show()"
-                )
+            saved_fb_pos = getattr(floating_button, "_saved_pos", None)
+            if saved_fb_pos is not None:
+                floating_button.move(saved_fb_pos)
             else:
-                try:
-                    saved_fb_pos = getattr(self.floating_button, "_saved_pos", None)
-                    if saved_fb_pos is not None:
-                        try:
-                            self.floating_button.move(saved_fb_pos)
-                        except Exception:
-                            print(
-                                "[DBG main_window] floating_button.move(saved_pos) failed, positioning bottom-right"
-                            )
-                            self.floating_button.position_bottom_right()
-                    else:
-                        self.floating_button.position_bottom_right()
-                    self.floating_button.show()
-                    print("[DBG main_window] floating_button.show() called")
-                except Exception as e:
-                    print(f"[DBG main_window] floating_button.show() raised: {e}")
+                floating_button.position_bottom_right()
+            floating_button.show()
+            dbg("main_window: floating_button.show() called")
         except Exception as e:
-            print(f"[DBG main_window] _minimize_to_floating outer exception: {e}")
+            dbg("main_window: floating_button.show() raised: %s", e)
         try:
             self.tray.show_message(
                 "Voice Translator", "Running in background. Press F8 to record."
@@ -544,6 +493,7 @@ class FloatingWidget(DraggableWidget):
         except Exception:
             pass
 
+    @Slot(bool)
     def _on_floating_button_toggled(self, checked: bool):
         """Sync floating button toggle with main record button."""
         try:
@@ -558,8 +508,8 @@ class FloatingWidget(DraggableWidget):
             if event.type() == event.Type.WindowStateChange:
                 if self.isMinimized():
                     # Show floating button when minimized
-                    self.floating_button.show()
-                else:
+                    self._ensure_floating_button().show()
+                elif self.floating_button is not None:
                     self.floating_button.hide()
         except Exception:
             pass
@@ -575,112 +525,135 @@ class FloatingWidget(DraggableWidget):
             super().closeEvent(event)
 
     def _copy_text(self, text_edit: QTextEdit):
-        clipboard = QApplication.clipboard()
-        clipboard.setText(text_edit.toPlainText())
-        try:
-            # update status with copy feedback
-            self.status_label.setText("📋 Copied to clipboard!")
-            # revert status after a short delay, preserving recording state
-            QTimer.singleShot(1500, self._restore_status)
-        except Exception:
-            pass
+        self._clipboard.setText(text_edit.toPlainText())
+        # Copy feedback; reverts after a short delay, preserving recording state
+        self._set_status("📋 Copied to clipboard!")
 
+    @Slot()
     def _restore_status(self):
         """Restore status label depending on current recording state."""
-        try:
-            if getattr(self, "record_button", None) and self.record_button.isChecked():
-                self.status_label.setText("🔴 Recording...")
-                self.status_label.setStyleSheet(STATUS_RECORDING + " font-size: 14px;")
-            else:
-                self.status_label.setText("✅ Ready - Press F8 to record")
-                self.status_label.setStyleSheet(STATUS_READY + " font-size: 14px;")
-        except Exception:
-            pass
+        if self.record_button.isChecked():
+            self.status_label.setText("🔴 Recording...")
+            self._set_status_state(STATUS_RECORDING)
+        else:
+            self.status_label.setText("✅ Ready - Press F8 to record")
+            self._set_status_state(STATUS_READY)
 
+    @Slot(bool)
     def _on_record_toggled(self, checked: bool):
         if checked:
             self.record_button.setText("⏹ STOP")
-            self.record_button.setStyleSheet(RECORD_BUTTON_RECORDING)
+            _set_style_property(self.record_button, "recording", True)
             try:
-                self.status_label.setText("⏳ Loading model...")
-                # Create and load model (may block briefly)
-                self.transcriber = Transcriber()
-                try:
-                    self.transcriber.load_model()
-                except TranscriberError as e:
-                    self.status_label.setText(f"Model error: {e}")
-                    self.record_button.setChecked(False)
+                if self.transcriber is None:
+                    self.status_label.setText("⏳ Loading model...")
+                    # Create and load model once (may block briefly)
+                    transcriber = Transcriber()
+                    try:
+                        transcriber.load_model()
+                    except TranscriberError as e:
+                        self.status_label.setText(f"Model error: {e}")
+                        self.record_button.setChecked(False)
+                        return
+                    self.transcriber = transcriber
+                # Reuse one worker (and its recorder) across recordings
+                if self.worker is None:
+                    self.worker = RecordingWorker(self.transcriber)
+                    self.worker.finished.connect(self._on_worker_finished)
+                if self.worker.isRunning():
+                    # The previous recording is still decoding its tail on the
+                    # shared recognizer; start from _on_worker_finished instead
+                    self._start_pending = True
+                    self.status_label.setText("⏳ Finishing previous recording...")
                     return
-                # Start worker
-                self.worker = RecordingWorker(self.transcriber)
-                self.worker.start()
-                self.status_label.setText("🔴 Recording...")
-                self.status_label.setStyleSheet(STATUS_RECORDING + " font-size: 14px;")
+                self._start_recording()
             except Exception as e:
                 self.status_label.setText(f"Unexpected: {e}")
                 self.record_button.setChecked(False)
         else:
             self.record_button.setText("⏺ REC")
-            self.record_button.setStyleSheet(RECORD_BUTTON_IDLE)
-            try:
+            _set_style_property(self.record_button, "recording", False)
+            if self._start_pending:
+                # Queued take never started; the previous one keeps decoding
+                self._start_pending = False
+            elif self.worker is not None:
                 # Signal worker to stop; worker will emit transcription_complete when done
-                worker = getattr(self, "worker", None)
-                if worker is not None:
-                    try:
-                        worker.stop_recording()
-                    except Exception:
-                        pass
-                self.status_label.setText("Processing...")
-                self.status_label.setStyleSheet(STATUS_READY + " font-size: 14px;")
-            except Exception:
-                pass
+                self.worker.stop_recording()
+            self.status_label.setText("Processing...")
+            self._set_status_state(STATUS_READY)
+
+    def _start_recording(self):
+        self.worker.reset()
+        self.worker.start()
+        self.status_label.setText("🔴 Recording...")
+        self._set_status_state(STATUS_RECORDING)
+
+    @Slot()
+    def _on_worker_finished(self):
+        """Start the take queued while the previous one was still decoding."""
+        if not self._start_pending:
+            return
+        self._start_pending = False
+        if self.record_button.isChecked():
+            self._start_recording()
+
+    @Slot(str)
+    def _on_transcription_partial(self, text: str):
+        try:
+            # Live preview; replaced by the final text on completion
+            self.portuguese_text.setPlainText(text)
+        except Exception:
+            pass
 
+    @Slot(str)
     def _on_transcription_complete(self, text: str):
         try:
             self.portuguese_text.setPlainText(text)
             self.status_label.setText("✅ Ready - Press F8 to record")
-            self.status_label.setStyleSheet(STATUS_READY + " font-size: 14px;")
+            self._set_status_state(STATUS_READY)
         except Exception:
             pass
 
+    @Slot(str)
     def _on_transcription_error(self, msg: str):
         try:
             self.status_label.setText(f"Error: {msg}")
-            self.status_label.setStyleSheet(STATUS_READY + " font-size: 14px;")
+            self._set_status_state(STATUS_READY)
         except Exception:
             pass
 
-    def mousePressEvent(self, event):
-        if event.button() == Qt.MouseButton.LeftButton:
-            # Get global mouse position
-            try:
-                gp = event.globalPosition().toPoint()
-            except Exception:
-                gp = event.globalPos()
+    def mousePressEvent(self, event: QMouseEvent):
+        if event.button() == self._LEFT_BUTTON:
+            # PySide6 mouse events always provide globalPosition()
+            gp = event.globalPosition().toPoint()
             # Use DraggableWidget's _get_drag_offset helper
             self._drag_position = self._get_drag_offset(gp)
-            print(
-                f"[DBG main_window] mousePress gp={gp} drag_offset={self._drag_position}"
+            dbg(
+                "main_window: mousePress gp=%s drag_offset=%s", gp, self._drag_position
             )
-            # Request system move for Wayland support
-            self._request_system_move()
+            # No clickable children forward presses here, so the compositor
+            # can take the drag on every platform that supports it
+            self._request_system_move(any_platform=True)
             event.accept()
         else:
             super().mousePressEvent(event)
 
-    def mouseMoveEvent(self, event):
-        if event.buttons() & Qt.MouseButton.LeftButton:
-            try:
-                gp = event.globalPosition().toPoint()
-            except Exception:
-                gp = event.globalPos()
-            new_pos = gp - self._drag_position
-            self.move(new_pos)
-            print(f"[DBG main_window] mouseMove moved_to={new_pos}")
+    def mouseMoveEvent(self, event: QMouseEvent):
+        if event.buttons() & self._LEFT_BUTTON:
+            # The compositor moves the window itself during a system move
+            if not self._system_moving:
+                new_pos = event.globalPosition().toPoint() - self._drag_position
+                self._schedule_move(new_pos)
             event.accept()
         else:
             super().mouseMoveEvent(event)
 
+    def mouseReleaseEvent(self, event: QMouseEvent):
+        if event.button() == self._LEFT_BUTTON:
+            # Land on the final drag position without waiting for the timer
+            self._flush_move()
+        super().mouseReleaseEvent(event)
+
     def keyPressEvent(self, event):
         """Handle focused key presses as a fallback for global hotkeys.
 
@@ -708,9 +681,7 @@ class FloatingWidget(DraggableWidget):
             if f8_val is not None and key == f8_val:
                 try:
                     signals.toggle_recording.emit()
-                    self._write_debug_log(
-                        "[DBG main_window] keyPressEvent: F8 pressed, emitted toggle_recording"
-                    )
+                    dbg("main_window: keyPressEvent: F8 pressed, emitted toggle_recording")
                 except Exception:
                     pass
                 event.accept()
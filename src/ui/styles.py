@@ -93,36 +93,68 @@ QComboBox QAbstractItemView {
     color: #ffffff;
     selection-background-color: #0078d4;
 }
-"""
-
 
-RECORD_BUTTON_IDLE = """
-QPushButton {
+/* Record button; the `recording` property is toggled from code */
+QPushButton#recordButton {
     background-color: #dc3545;
     border-radius: 40px;
     border: none;
     color: #ffffff;
 }
-QPushButton:hover {
+QPushButton#recordButton:hover {
     background-color: #c82333;
 }
+QPushButton#recordButton[recording="true"] {
+    border: 3px solid #ffffff;
+}
+
+/* Status label; the `state` property is set from code (see STATUS_*) */
+QLabel#statusLabel {
+    color: #28a745;
+    font-size: 14px;
+}
+QLabel#statusLabel[state="recording"] {
+    color: #dc3545;
+}
+QLabel#statusLabel[state="processing"] {
+    color: #ffc107;
+}
+QLabel#statusLabel[state="error"] {
+    color: #dc3545;
+}
 """
 
 
-RECORD_BUTTON_RECORDING = """
-QPushButton {
-    background-color: #dc3545;
-    border-radius: 40px;
-    border: 3px solid #ffffff;
-    color: #ffffff;
+FLOATING_BUTTON = """
+QPushButton#floatingRecordButton {
+    background-color: rgba(220, 53, 69, 0.9);
+    border-radius: 30px;
+    border: 2px solid #dc3545;
+    color: white;
+    font-size: 24px;
 }
-QPushButton:hover {
-    background-color: #c82333;
+QPushButton#floatingRecordButton:hover {
+    background-color: rgba(220, 53, 69, 1.0);
+}
+QPushButton#floatingRecordButton:checked {
+    background-color: rgba(220, 53, 69, 1.0);
+    border: 3px solid white;
+}
+
+QPushButton#floatingRestoreButton {
+    background-color: rgba(0,0,0,0.4);
+    color: white;
+    border-radius: 11px;
+    font-weight: bold;
+}
+QPushButton#floatingRestoreButton:hover {
+    background-color: rgba(0,0,0,0.6);
 }
 """
 
 
-STATUS_READY = "color: #28a745;"
-STATUS_RECORDING = "color: #dc3545;"
-STATUS_PROCESSING = "color: #ffc107;"
-STATUS_ERROR = "color: #dc3545;"
+# Values for the status label's `state` property; colors live in DARK_THEME
+STATUS_READY = "ready"
+STATUS_RECORDING = "recording"
+STATUS_PROCESSING = "processing"
+STATUS_ERROR = "error"
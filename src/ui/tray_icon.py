@@ -4,6 +4,7 @@
 from PySide6.QtGui import QIcon, QAction
 from PySide6.QtCore import Signal, QObject
 
+from src.utils.debug_log import dbg
 from src.utils.paths import get_assets_path
 
 
@@ -113,7 +114,7 @@ class TrayIcon(QObject):
         try:
             self.tray.show()
         except Exception as e:
-            print(f"[DBG TrayIcon] show() failed: {e}")
+            dbg("TrayIcon: show() failed: %s", e)
 
     def hide(self):
         """Hide the tray icon."""
@@ -122,7 +123,7 @@ class TrayIcon(QObject):
         try:
             self.tray.hide()
         except Exception as e:
-            print(f"[DBG TrayIcon] hide() failed: {e}")
+            dbg("TrayIcon: hide() failed: %s", e)
 
     def show_message(self, title: str, message: str):
         """Show a balloon notification from the tray icon.
@@ -136,4 +137,4 @@ class TrayIcon(QObject):
         try:
             self.tray.showMessage(title, message)
         except Exception as e:
-            print(f"[DBG TrayIcon] show_message failed: {e}")
+            dbg("TrayIcon: show_message failed: %s", e)
@@ -0,0 +1,57 @@
+"""Debug logging for the application.
+
+Modules log through `dbg(...)` with %-style arguments, e.g.
+`dbg("main_window: moved to %s", pos)`, so messages are only formatted when
+debug logging is enabled. `setup_debug_log()` enables it when `VT_DEBUG` is
+set, writing to stderr and to a rotating per-user log file. File writes are
+buffered and flushed in batches.
+"""
+
+import logging
+import os
+from logging.handlers import MemoryHandler, RotatingFileHandler
+from typing import Optional
+
+LOG_PATH = os.path.expanduser("~/.voice_translator_debug.log")
+# Buffered records before the file handler is written to
+LOG_BATCH = 256
+
+logger = logging.getLogger("vt.dbg")
+logger.setLevel(logging.WARNING)
+dbg = logger.debug
+
+
+def setup_debug_log(path: Optional[str] = None) -> None:
+    """Attach handlers to the `vt.dbg` logger.
+
+    Debug records are only emitted when the `VT_DEBUG` environment variable
+    is set; otherwise the logger stays at WARNING and `dbg()` calls return
+    without formatting. Safe to call more than once.
+    """
+    if logger.handlers:
+        return
+    enabled = bool(os.environ.get("VT_DEBUG"))
+    logger.setLevel(logging.DEBUG if enabled else logging.WARNING)
+    logger.propagate = False
+
+    formatter = logging.Formatter("[DBG %(asctime)s] %(message)s")
+    console = logging.StreamHandler()
+    console.setFormatter(formatter)
+    logger.addHandler(console)
+    if not enabled:
+        return
+    try:
+        file_handler = RotatingFileHandler(
+            path or LOG_PATH,
+            maxBytes=1 << 20,
+            backupCount=3,
+            encoding="utf-8",
+            delay=True,
+        )
+    except OSError:
+        return
+    file_handler.setFormatter(formatter)
+    # Flushed when full, on warnings, and by logging.shutdown() at exit
+    logger.addHandler(
+        MemoryHandler(LOG_BATCH, flushLevel=logging.WARNING, target=file_handler)
+    )
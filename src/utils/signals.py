@@ -22,6 +22,8 @@ class AppSignals(QObject):
 
     # Transcription signals
     transcription_started = Signal()
+    # Running transcript while audio is still being decoded
+    transcription_partial = Signal(str)
     transcription_complete = Signal(str)
     transcription_error = Signal(str)
 
@@ -22,6 +22,9 @@ if not os.environ.get("VOSK_TEST_FULL"):
             self._buf.extend(data)
             return True
 
+        def Reset(self) -> None:
+            self._buf.clear()
+
         def FinalResult(self) -> str:
             return json.dumps({"text": ""})
 
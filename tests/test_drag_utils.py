@@ -1,8 +1,11 @@
 """Tests for drag_utils module."""
 
 import sys
+import time
 from pathlib import Path
 
+import pytest
+
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
@@ -40,6 +43,77 @@ def test_draggable_widget_attributes():
     print("✓ DraggableWidget has all required attributes and methods")
 
 
+def test_platform_name_is_cached():
+    from PySide6.QtGui import QGuiApplication
+    from PySide6.QtWidgets import QApplication
+    from src.ui import drag_utils
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    name = drag_utils.platform_name()
+    assert name == QGuiApplication.platformName().lower()
+    assert drag_utils._platform_name == name
+
+
+def test_drag_offset_is_relative_to_window_pos():
+    from PySide6.QtCore import QPoint
+    from PySide6.QtWidgets import QApplication
+    from src.ui.drag_utils import DraggableWidget
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    widget = DraggableWidget()
+    widget.move(QPoint(10, 20))
+    assert widget._get_drag_offset(QPoint(15, 27)) == QPoint(5, 7)
+
+
+def test_scheduled_moves_coalesce():
+    """Several scheduled moves collapse into one move() to the latest target."""
+    from PySide6.QtCore import QPoint
+    from PySide6.QtWidgets import QApplication
+    from src.ui.drag_utils import DraggableWidget
+
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    moves = []
+
+    class Recorder(DraggableWidget):
+        def move(self, *args):
+            moves.append(args[0])
+
+    widget = Recorder()
+    for x in range(5):
+        widget._schedule_move(QPoint(x, x))
+    assert moves == []
+    deadline = time.monotonic() + 2
+    while not moves and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.005)
+    assert moves == [QPoint(4, 4)]
+
+    # Flushing directly (e.g. on release) applies a still-pending move
+    widget._schedule_move(QPoint(9, 9))
+    widget._flush_move()
+    app.processEvents()
+    assert moves == [QPoint(4, 4), QPoint(9, 9)]
+
+    # A move to the current position is skipped
+    widget._schedule_move(widget.pos())
+    widget._flush_move()
+    assert moves == [QPoint(4, 4), QPoint(9, 9)]
+
+
+def test_system_move_unavailable_offscreen():
+    """Without a compositor the drag falls back to manual moves."""
+    from PySide6.QtWidgets import QApplication
+    from src.ui.drag_utils import DraggableWidget, platform_name
+
+    QApplication.instance() or QApplication(sys.argv)
+    widget = DraggableWidget()
+    if platform_name() != "offscreen":
+        pytest.skip("needs the offscreen platform")
+    assert widget._request_system_move(any_platform=True) is False
+    assert widget._system_moving is False
+
+
 if __name__ == "__main__":
     test_draggable_widget_import()
     test_draggable_widget_attributes()
@@ -0,0 +1,37 @@
+"""Tests for the audio conversion kernels in src.core.dsp."""
+
+import numpy as np
+
+from src.core.dsp import float_to_int16, trim_silence
+
+
+def test_float_to_int16_matches_reference():
+    src = np.linspace(-1.5, 1.5, 1001, dtype=np.float32)
+    expected = (np.clip(src, -1.0, 1.0) * 32767).astype(np.int16)
+    out = float_to_int16(src)
+    assert out.dtype == np.int16
+    assert np.array_equal(out, expected)
+
+
+def test_float_to_int16_writes_into_buffers():
+    src = np.full((160, 1), 0.5, dtype=np.float64)
+    out = np.zeros(160, dtype=np.int16)
+    scratch = np.empty(160, dtype=np.float32)
+    result = float_to_int16(src, out=out, scratch=scratch)
+    assert result is out
+    assert np.all(out == 16383)
+
+
+def test_trim_silence_drops_leading_and_trailing_quiet():
+    rate = 16000
+    quiet = np.zeros(rate, dtype=np.int16)
+    tone = (np.sin(np.arange(rate) / 5.0) * 8000).astype(np.int16)
+    samples = np.concatenate([quiet, tone, quiet])
+    trimmed = trim_silence(samples, rate)
+    # The tone survives, most of the 2 s of silence does not
+    assert rate <= trimmed.size < samples.size - rate
+    assert np.shares_memory(trimmed, samples)
+
+
+def test_trim_silence_all_quiet_returns_empty():
+    assert trim_silence(np.zeros(16000, dtype=np.int16), 16000).size == 0
@@ -0,0 +1,184 @@
+"""Tests for the FIFO consumer WAV stream parsing and forwarding."""
+
+import asyncio
+import io
+import os
+import stat
+import wave
+from concurrent.futures import Future
+
+import numpy as np
+import pytest
+
+from src.core import fifo_consumer
+from src.core.fifo_consumer import WavStreamParser, _extract_pcm_from_buf
+
+
+def _make_wav(pcm: bytes, rate: int = 16000, channels: int = 1) -> bytes:
+    out = io.BytesIO()
+    with wave.open(out, "wb") as wf:
+        wf.setnchannels(channels)
+        wf.setsampwidth(2)
+        wf.setframerate(rate)
+        wf.writeframes(pcm)
+    return out.getvalue()
+
+
+def _pcm(n: int = 4000) -> bytes:
+    return (np.arange(n, dtype=np.int16) - n // 2).tobytes()
+
+
+class FakeWorker:
+    def __init__(self):
+        self.whole = []
+        self.chunks = []
+        self.finished = 0
+
+    def process_pcm(self, pcm):
+        self.whole.append(pcm)
+
+    def process_pcm_chunk(self, pcm):
+        self.chunks.append(pcm)
+
+    def finish_pcm_stream(self):
+        self.finished += 1
+
+
+def test_extract_raw_pcm_passthrough():
+    pcm = _pcm()
+    assert _extract_pcm_from_buf(pcm) == pcm
+    assert _extract_pcm_from_buf(b"") == b""
+
+
+def test_extract_wav_strips_header():
+    pcm = _pcm()
+    assert _extract_pcm_from_buf(_make_wav(pcm)) == pcm
+
+
+def test_extract_rejects_unsupported_format():
+    with pytest.raises(RuntimeError):
+        _extract_pcm_from_buf(_make_wav(_pcm(), rate=8000))
+
+
+@pytest.mark.parametrize("block", [1, 3, 7, 44, 1000])
+def test_parser_handles_arbitrary_block_boundaries(block):
+    pcm = _pcm()
+    wav = _make_wav(pcm)
+    parser = WavStreamParser()
+    out = bytearray()
+    for i in range(0, len(wav), block):
+        chunk = parser.feed(wav[i : i + block])
+        assert len(chunk) % 2 == 0
+        out.extend(chunk)
+    out.extend(parser.close())
+    assert bytes(out) == pcm
+
+
+def test_parser_truncated_header_raises():
+    parser = WavStreamParser()
+    parser.feed(_make_wav(_pcm())[:20])
+    with pytest.raises(RuntimeError):
+        parser.close()
+
+
+def test_forward_small_payload_uses_process_pcm():
+    pcm = _pcm()
+    worker = FakeWorker()
+    fifo_consumer._forward_stream(io.BytesIO(_make_wav(pcm)), worker)
+    assert worker.whole == [pcm]
+    assert worker.chunks == [] and worker.finished == 0
+
+
+def test_forward_reuses_read_buffer_across_payloads():
+    read_buf = bytearray(256)
+    worker = FakeWorker()
+    first, second = _pcm(1000), _pcm(3000)
+    fifo_consumer._forward_stream(io.BytesIO(_make_wav(first)), worker, read_buf)
+    fifo_consumer._forward_stream(io.BytesIO(second), worker, read_buf)
+    assert worker.whole == [first, second]
+
+
+def test_forward_large_payload_streams_chunks(monkeypatch):
+    monkeypatch.setattr(fifo_consumer, "READ_BLOCK_SIZE", 1024)
+    monkeypatch.setattr(fifo_consumer, "STREAM_THRESHOLD", 2048)
+    pcm = _pcm(8000)
+    worker = FakeWorker()
+    fifo_consumer._forward_stream(io.BytesIO(_make_wav(pcm)), worker)
+    assert worker.whole == []
+    assert len(worker.chunks) > 1
+    assert b"".join(worker.chunks) == pcm
+    assert worker.finished == 1
+
+
+class BrokenReader(io.BytesIO):
+    """Fails with a read error once `limit` bytes have been delivered."""
+
+    def __init__(self, data, limit):
+        super().__init__(data)
+        self.limit = limit
+
+    def readinto(self, buf):
+        if self.tell() >= self.limit:
+            raise OSError("writer went away")
+        return super().readinto(buf)
+
+
+def test_forward_failed_stream_is_closed_before_next_payload(monkeypatch):
+    monkeypatch.setattr(fifo_consumer, "READ_BLOCK_SIZE", 1024)
+    monkeypatch.setattr(fifo_consumer, "STREAM_THRESHOLD", 2048)
+    worker = FakeWorker()
+    broken = BrokenReader(_make_wav(_pcm(8000)), limit=4096)
+    with pytest.raises(OSError):
+        fifo_consumer._forward_stream(broken, worker)
+    assert worker.chunks and worker.finished == 1
+
+    worker.chunks.clear()
+    pcm = _pcm(8000)
+    fifo_consumer._forward_stream(io.BytesIO(_make_wav(pcm)), worker)
+    assert b"".join(worker.chunks) == pcm
+    assert worker.finished == 2
+
+
+class FakePool:
+    """Completes each submission with the number of samples received."""
+
+    def __init__(self):
+        self.sizes = []
+
+    def submit(self, audio):
+        self.sizes.append(audio.size)
+        fut = Future()
+        fut.set_result(f"{audio.size} samples")
+        return fut
+
+
+def test_serve_unix_handles_concurrent_clients(tmp_path):
+    sock = str(tmp_path / "t.sock")
+    pool = FakePool()
+
+    async def client(payload):
+        reader, writer = await asyncio.open_unix_connection(sock)
+        writer.write(payload)
+        writer.write_eof()
+        reply = await reader.readline()
+        writer.close()
+        return reply
+
+    async def scenario():
+        server = asyncio.ensure_future(fifo_consumer.serve_unix(sock, pool))
+        for _ in range(100):
+            if (tmp_path / "t.sock").exists():
+                break
+            await asyncio.sleep(0.01)
+        mode = stat.S_IMODE(os.stat(sock).st_mode)
+        try:
+            return mode, await asyncio.gather(
+                client(_make_wav(_pcm(4000))), client(_pcm(1000))
+            )
+        finally:
+            server.cancel()
+
+    mode, replies = asyncio.run(scenario())
+    assert mode == 0o600
+    assert replies == [b"4000 samples\n", b"1000 samples\n"]
+    assert sorted(pool.sizes) == [1000, 4000]
@@ -96,6 +96,27 @@ def test_overflow_tracking():
     assert recorder._overflow_count >= 1
 
 
+def test_callback_buffer_grows_and_preserves_order():
+    recorder = AudioRecorder()
+    recorder._recording = True
+    blocks = [np.full((100, 1), i, dtype=np.int16) for i in range(50)]
+    for block in blocks:
+        recorder._audio_callback(block, 100, None, None)
+
+    audio = recorder.stop()
+    assert audio.dtype == np.int16
+    assert np.array_equal(audio, np.concatenate(blocks).reshape(-1))
+
+
+def test_callback_converts_float_blocks():
+    recorder = AudioRecorder()
+    recorder._recording = True
+    recorder._audio_callback(np.full((100, 1), 2.0, dtype=np.float32), 100, None, None)
+    audio = recorder.stop()
+    assert audio.dtype == np.int16
+    assert np.all(audio == 32767)
+
+
 if __name__ == "__main__":
     test_list_devices()
     test_record_audio()
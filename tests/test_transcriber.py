@@ -28,6 +28,9 @@ def mock_vosk(monkeypatch):
             self._buf.extend(data)
             return True
 
+        def Reset(self) -> None:
+            self._buf.clear()
+
         def FinalResult(self) -> str:
             return json.dumps({"text": ""})
 
@@ -84,3 +87,143 @@ def test_transcribe_audio_handling(
         assert isinstance(result, str)
     else:
         assert result == expected_result
+
+
+def test_recognizer_reused_across_calls(monkeypatch) -> None:
+    created = []
+
+    class CountingRecognizer:
+        def __init__(self, model, sample_rate):
+            created.append(self)
+            self.resets = 0
+
+        def AcceptWaveform(self, data: bytes) -> bool:
+            return True
+
+        def Reset(self) -> None:
+            self.resets += 1
+
+        def FinalResult(self) -> str:
+            return json.dumps({"text": "ok"})
+
+    monkeypatch.setattr(transcriber_mod, "KaldiRecognizer", CountingRecognizer)
+    t = Transcriber()
+    t.load_model()
+    for _ in range(3):
+        assert t.transcribe(np.zeros(1600, dtype=np.int16)) == "ok"
+
+    assert len(created) == 1
+    assert created[0].resets == 3
+
+
+def test_feed_chunk_and_finalize_collect_segments(monkeypatch) -> None:
+    class SegmentingRecognizer:
+        def __init__(self, model, sample_rate):
+            self._chunks = 0
+
+        def AcceptWaveform(self, data: bytes) -> bool:
+            self._chunks += 1
+            # Report an utterance endpoint after the first chunk
+            return self._chunks == 1
+
+        def Reset(self) -> None:
+            self._chunks = 0
+
+        def Result(self) -> str:
+            return json.dumps({"text": "first"})
+
+        def PartialResult(self) -> str:
+            return json.dumps({"partial": "sec"})
+
+        def FinalResult(self) -> str:
+            return json.dumps({"text": "second"})
+
+    monkeypatch.setattr(transcriber_mod, "KaldiRecognizer", SegmentingRecognizer)
+    t = Transcriber()
+    t.load_model()
+    partials = []
+    pcm = np.zeros(1600, dtype=np.int16).tobytes()
+    t.feed_chunk(pcm)
+    t.feed_chunk(pcm, on_partial=partials.append)
+
+    # Partial callbacks see the finalized segments plus the live hypothesis
+    assert partials == ["first sec"]
+    assert t.finalize() == "first second"
+    # Stream is closed; nothing pending
+    assert t.finalize() == ""
+
+
+@pytest.mark.parametrize(
+    "payload, key, expected",
+    [
+        ('{\n  "text" : "olá mundo"\n}', "text", "olá mundo"),
+        ('{\n  "partial" : "olá"\n}', "partial", "olá"),
+        ('{"text": "say \\"hi\\""}', "text", 'say "hi"'),
+        ('{"result": [{"word": "a"}], "text": "a"}', "text", "a"),
+        ('{"partial" : "x"}', "text", ""),
+    ],
+)
+def test_result_text_parsing(payload, key, expected) -> None:
+    assert Transcriber._result_text(payload, key) == expected
+
+
+def test_transcribe_batch_returns_results_in_order(monkeypatch) -> None:
+    class LengthRecognizer:
+        def __init__(self, model, sample_rate):
+            self._n = 0
+
+        def AcceptWaveform(self, data: bytes) -> bool:
+            self._n += len(data)
+            return False
+
+        def Reset(self) -> None:
+            self._n = 0
+
+        def FinalResult(self) -> str:
+            return json.dumps({"text": str(self._n // 2)})
+
+    monkeypatch.setattr(transcriber_mod, "KaldiRecognizer", LengthRecognizer)
+    t = Transcriber()
+    t.load_model()
+    sizes = [1600, 0, 32000, 800, 16001]
+    audios = [np.zeros(n, dtype=np.int16) for n in sizes]
+    texts = t.transcribe_batch(audios, workers=3)
+    assert texts == ["1600", "", "32000", "800", "16001"]
+
+
+def test_transcribe_batch_resizes_and_closes_pool() -> None:
+    t = Transcriber()
+    t.load_model()
+    audios = [np.zeros(160, dtype=np.int16)] * 2
+    t.transcribe_batch(audios, workers=2)
+    first = t._pool
+    t.transcribe_batch(audios)
+    assert t._pool is first
+    t.transcribe_batch(audios, workers=3)
+    assert first.closed and t._pool.size == 3
+    transcriber_mod.clear_model_cache()
+    assert t._pool.closed
+    assert t.transcribe_batch(audios) == ["", ""]
+    t.close()
+    assert t._pool is None
+
+
+def test_model_loaded_once_per_path(monkeypatch) -> None:
+    loads = []
+
+    def CountingModel(path):
+        loads.append(path)
+        return object()
+
+    monkeypatch.setattr(transcriber_mod, "Model", CountingModel)
+    transcriber_mod.clear_model_cache()
+    try:
+        a = Transcriber(model_path="/models/a")
+        b = Transcriber(model_path="/models/a")
+        a.load_model()
+        b.load_model()
+        assert a._model is b._model
+        transcriber_mod.preload_model("/models/b")
+        assert loads == ["/models/a", "/models/b"]
+    finally:
+        transcriber_mod.clear_model_cache()
@@ -21,6 +21,9 @@ def mock_vosk_inject(monkeypatch):
             self._buf.extend(data)
             return True
 
+        def Reset(self) -> None:
+            self._buf.clear()
+
         def FinalResult(self) -> str:
             # Return text when any audio was fed
             text = "hello world" if len(self._buf) > 0 else ""
@@ -42,3 +45,12 @@ def test_feed_pcm_transcribes_nonempty():
     text = t.feed_pcm(pcm)
     assert isinstance(text, str)
     assert text == "hello world"
+
+
+def test_feed_pcm_accepts_buffer_objects():
+    t = Transcriber()
+    t.load_model()
+    pcm = np.arange(1600, dtype=np.int16).tobytes()
+    assert t.feed_pcm(bytearray(pcm)) == "hello world"
+    assert t.feed_pcm(memoryview(pcm)) == "hello world"
+    assert t.feed_pcm(memoryview(b"")) == ""
@@ -4,9 +4,27 @@ Note: these tests perform real network calls and require an internet
 connection. They may be skipped in CI environments.
 """
 
+import time
+
+import pytest
+
+from src.core import translator as translator_mod
 from src.core.translator import Translator, TranslatorError
 
 
+def _fake_engines(monkeypatch, behaviours):
+    """Route ts.translate_text to per-engine callables; record calls."""
+    calls = []
+
+    def fake_translate_text(query_text, translator, **kwargs):
+        assert kwargs.get("is_detail_result") is False
+        calls.append(translator)
+        return behaviours[translator](query_text)
+
+    monkeypatch.setattr(translator_mod.ts, "translate_text", fake_translate_text)
+    return calls
+
+
 def test_available_languages() -> None:
     langs = Translator.get_available_languages()
     print("Available languages:", langs)
@@ -21,6 +39,85 @@ def test_empty_text() -> None:
     assert t.translate("   ", "English") == ""
 
 
+def test_falls_back_when_first_engine_fails(monkeypatch) -> None:
+    def broken(_):
+        raise RuntimeError("down")
+
+    _fake_engines(monkeypatch, {"google": broken, "bing": lambda q: "bing:" + q})
+    t = Translator()
+    assert t.translate("Bom dia", "English") == "bing:Bom dia"
+    assert t.get_last_engine() == "bing"
+
+
+def test_slow_engine_is_hedged(monkeypatch) -> None:
+    def slow(q):
+        time.sleep(0.5)
+        return "google:" + q
+
+    _fake_engines(monkeypatch, {"google": slow, "bing": lambda q: "bing:" + q})
+    t = Translator()
+    t.HEDGE_DELAY = 0.05
+    assert t.translate("Bom dia", "English") == "bing:Bom dia"
+
+
+def test_repeated_translation_is_cached(monkeypatch) -> None:
+    calls = _fake_engines(
+        monkeypatch, {"google": lambda q: "google:" + q, "bing": lambda q: "bing:" + q}
+    )
+    t = Translator()
+    assert t.translate("Bom dia", "English") == "google:Bom dia"
+    assert t.translate("Bom dia", "English") == "google:Bom dia"
+    assert calls == ["google"]
+
+
+def test_cache_hit_reports_engine_that_answered(monkeypatch) -> None:
+    def broken(_):
+        raise RuntimeError("down")
+
+    behaviours = {"google": broken, "bing": lambda q: "bing:" + q}
+    _fake_engines(monkeypatch, behaviours)
+    t = Translator()
+    assert t.translate("Bom dia", "English") == "bing:Bom dia"
+    behaviours["google"] = lambda q: "google:" + q
+    assert t.translate("Boa tarde", "English") == "google:Boa tarde"
+    assert t.get_last_engine() == "google"
+    assert t.translate("Bom dia", "English") == "bing:Bom dia"
+    assert t.get_last_engine() == "bing"
+    t.close()
+
+
+def test_detailed_results_are_reduced_to_text(monkeypatch) -> None:
+    _fake_engines(
+        monkeypatch,
+        {
+            "google": lambda q: [[["Good ", q], ["morning", q]]],
+            "bing": lambda q: {"translations": [{"text": "Good morning"}]},
+        },
+    )
+    t = Translator()
+    assert t.translate("Bom dia", "English") == "Good morning"
+    t.ENGINES = ["bing"]
+    assert t.translate("Boa tarde", "English") == "Good morning"
+
+
+def test_unknown_result_shape_falls_back(monkeypatch) -> None:
+    _fake_engines(
+        monkeypatch, {"google": lambda q: {"odd": q}, "bing": lambda q: "bing:" + q}
+    )
+    t = Translator()
+    assert t.translate("Bom dia", "English") == "bing:Bom dia"
+
+
+def test_all_engines_failing_raises(monkeypatch) -> None:
+    def broken(_):
+        raise RuntimeError("down")
+
+    _fake_engines(monkeypatch, {"google": broken, "bing": broken})
+    t = Translator()
+    with pytest.raises(TranslatorError):
+        t.translate("Bom dia", "English")
+
+
 def test_basic_translation() -> None:
     t = Translator()
     res = t.translate("Olá, como você está?", "English")
@@ -0,0 +1,61 @@
+"""Tests for zero-copy WAV parsing in src.core.wav_reader."""
+
+import io
+import struct
+import wave
+
+import numpy as np
+import pytest
+
+from src.core.wav_reader import load_wav_mmap, parse_wav_header
+
+
+def _make_wav(samples: np.ndarray, rate: int = 16000) -> bytes:
+    out = io.BytesIO()
+    with wave.open(out, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(rate)
+        wf.writeframes(samples.tobytes())
+    return out.getvalue()
+
+
+def test_parse_header_skips_extra_chunks():
+    samples = np.arange(100, dtype=np.int16)
+    wav = _make_wav(samples)
+    # Insert an odd-sized LIST chunk (plus pad byte) before the data chunk
+    extra = b"LIST" + struct.pack("<I", 3) + b"abc\x00"
+    data_at = wav.index(b"data")
+    wav = wav[:data_at] + extra + wav[data_at:]
+    offset, size = parse_wav_header(wav)
+    assert wav[offset : offset + size] == samples.tobytes()
+
+
+def test_parse_header_canonical_fast_path():
+    samples = np.arange(100, dtype=np.int16)
+    wav = _make_wav(samples)
+    assert parse_wav_header(wav) == (44, samples.nbytes)
+    # Streaming encoders write a placeholder data size
+    streamed = wav[:40] + struct.pack("<I", 0xFFFFFFFF) + wav[44:]
+    assert parse_wav_header(streamed) == (44, samples.nbytes)
+
+
+def test_parse_header_rejects_non_wav():
+    with pytest.raises(RuntimeError):
+        parse_wav_header(b"\x00" * 64)
+
+
+def test_load_wav_mmap(tmp_path):
+    samples = (np.arange(4000, dtype=np.int16) - 2000) * 3
+    path = tmp_path / "clip.wav"
+    path.write_bytes(_make_wav(samples))
+    audio = load_wav_mmap(str(path))
+    assert audio.dtype == np.int16
+    assert np.array_equal(audio, samples)
+
+
+def test_load_wav_mmap_rejects_unsupported_rate(tmp_path):
+    path = tmp_path / "clip.wav"
+    path.write_bytes(_make_wav(np.zeros(10, dtype=np.int16), rate=44100))
+    with pytest.raises(RuntimeError):
+        load_wav_mmap(str(path))
@@ -90,5 +90,267 @@ def test_recording_worker():
     print("Worker test completed!")
 
 
+def test_translation_worker_runs_on_thread_pool():
+    """TranslationWorker is a pooled task that reports via signals."""
+    from PySide6.QtCore import QThreadPool
+    from src.core.workers import TranslationWorker
+
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    class FakeTranslator:
+        def translate(self, text, target_language):
+            return f"{target_language}:{text}"
+
+    results = []
+
+    def on_complete(text):
+        results.append(text)
+
+    signals.translation_complete.connect(on_complete)
+    try:
+        pool = QThreadPool.globalInstance()
+        pool.start(TranslationWorker(FakeTranslator(), "Bom dia", "English"))
+        assert pool.waitForDone(5000)
+        # Deliver the queued cross-thread signal
+        app.processEvents()
+    finally:
+        signals.translation_complete.disconnect(on_complete)
+    assert results == ["English:Bom dia"]
+
+
+def test_process_pcm_accepts_buffers_and_rejects_odd_length():
+    """process_pcm takes any int16 buffer and rejects half samples."""
+    from array import array
+
+    class FakeTranscriber:
+        def __init__(self):
+            self.fed = []
+
+        def feed_pcm(self, pcm):
+            self.fed.append(bytes(pcm))
+            return "ok"
+
+    transcriber = FakeTranscriber()
+    worker = RecordingWorker(transcriber)
+    pcm = np.arange(8, dtype=np.int16)
+    errors = []
+
+    def on_error(error):
+        errors.append(error)
+
+    signals.transcription_error.connect(on_error)
+    try:
+        worker.process_pcm(memoryview(pcm.tobytes()))
+        worker.process_pcm(array("h", pcm.tolist()))
+        worker.process_pcm(b"\x00\x01\x02")
+    finally:
+        signals.transcription_error.disconnect(on_error)
+
+    assert transcriber.fed == [pcm.tobytes(), pcm.tobytes()]
+    assert len(errors) == 1
+
+
+def test_translation_dispatcher_keeps_only_latest_request():
+    """Requests made mid-flight collapse to the newest; stale results drop."""
+    import threading
+    from PySide6.QtCore import QThreadPool
+    from src.core.workers import TranslationDispatcher
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    release = threading.Event()
+
+    class BlockingTranslator:
+        def __init__(self):
+            self.calls = []
+
+        def translate(self, text, target_language):
+            self.calls.append(text)
+            if text == "um":
+                release.wait(5)
+            return f"{target_language}:{text}"
+
+    translator = BlockingTranslator()
+    pool = QThreadPool()
+    dispatcher = TranslationDispatcher(translator, pool)
+    results = []
+
+    def on_complete(text):
+        results.append(text)
+
+    signals.translation_complete.connect(on_complete)
+    try:
+        dispatcher.request("um", "English")
+        dispatcher.request("dois", "English")
+        dispatcher.request("tres", "English")
+        release.set()
+        assert pool.waitForDone(5000)
+        app.processEvents()
+    finally:
+        signals.translation_complete.disconnect(on_complete)
+
+    assert translator.calls == ["um", "tres"]
+    assert results == ["English:tres"]
+
+
+def test_streaming_error_stops_recorder_and_resets_stream(monkeypatch):
+    """A failed take releases the mic and leaves nothing for the next take."""
+    import json
+    import src.core.workers as workers_mod
+    from src.core.recorder import AudioRecorderError
+
+    class StreamingRecorder:
+        def __init__(self):
+            self.running = False
+
+        def start(self):
+            if self.running:
+                raise AudioRecorderError("already recording")
+            self.running = True
+
+        def read_new_samples(self):
+            return np.ones(100, dtype=np.int16)
+
+        def stop(self):
+            self.running = False
+            return np.ones(40, dtype=np.int16)
+
+    class CountingRecognizer:
+        """Reports how many samples it decoded since the last Reset()."""
+
+        def __init__(self):
+            self.samples = 0
+            self.calls = 0
+
+        def AcceptWaveform(self, data):
+            self.calls += 1
+            if self.calls == 2:
+                raise RuntimeError("decoder crashed")
+            self.samples += len(data) // 2
+            return False
+
+        def PartialResult(self):
+            return json.dumps({"partial": ""})
+
+        def Reset(self):
+            self.samples = 0
+
+        def FinalResult(self):
+            return json.dumps({"text": f"{self.samples} samples"})
+
+    monkeypatch.setattr(workers_mod, "AudioRecorder", StreamingRecorder)
+    transcriber = Transcriber()
+    transcriber._model = object()
+    transcriber._recognizer = CountingRecognizer()
+    worker = RecordingWorker(transcriber)
+    texts, errors = [], []
+
+    def on_complete(text):
+        texts.append(text)
+
+    def on_error(error):
+        errors.append(error)
+
+    signals.transcription_complete.connect(on_complete)
+    signals.transcription_error.connect(on_error)
+    try:
+        # First take: the second streamed block fails mid-recording
+        worker.run()
+        assert len(errors) == 1 and texts == []
+        assert not worker.recorder.running
+
+        # Second take: only its own 40-sample tail is decoded
+        worker.reset()
+        worker.stop_recording()
+        worker.run()
+    finally:
+        signals.transcription_complete.disconnect(on_complete)
+        signals.transcription_error.disconnect(on_error)
+
+    assert len(errors) == 1
+    assert texts == ["40 samples"]
+
+
+def test_failed_recorder_start_can_be_retried(monkeypatch):
+    """A take whose input stream fails to open doesn't wedge the recorder."""
+    import json
+    from types import SimpleNamespace
+    import src.core.recorder as recorder_mod
+    import src.core.workers as workers_mod
+
+    opened = []
+
+    class FlakyInputStream:
+        def __init__(self, callback, **kwargs):
+            opened.append(self)
+            if len(opened) == 1:
+                raise RuntimeError("device busy")
+            self.callback = callback
+
+        def start(self):
+            self.callback(np.ones((160, 1), dtype=np.int16), 160, None, None)
+
+        def stop(self):
+            pass
+
+        def close(self):
+            pass
+
+    class LengthRecognizer:
+        def __init__(self):
+            self.samples = 0
+
+        def AcceptWaveform(self, data):
+            self.samples += len(data) // 2
+            return False
+
+        def PartialResult(self):
+            return json.dumps({"partial": ""})
+
+        def Reset(self):
+            self.samples = 0
+
+        def FinalResult(self):
+            return json.dumps({"text": f"{self.samples} samples"})
+
+    fake_sd = SimpleNamespace(
+        default=SimpleNamespace(device=(0, None)),
+        query_devices=lambda: [{"name": "FakeIn", "max_input_channels": 1}],
+        check_input_settings=lambda **kwargs: None,
+        InputStream=FlakyInputStream,
+    )
+    monkeypatch.setattr(recorder_mod, "sd", fake_sd)
+    monkeypatch.setattr(workers_mod, "AudioRecorder", recorder_mod.AudioRecorder)
+    transcriber = Transcriber()
+    transcriber._model = object()
+    transcriber._recognizer = LengthRecognizer()
+    worker = RecordingWorker(transcriber)
+    texts, errors = [], []
+
+    def on_complete(text):
+        texts.append(text)
+
+    def on_error(error):
+        errors.append(error)
+
+    signals.transcription_complete.connect(on_complete)
+    signals.transcription_error.connect(on_error)
+    try:
+        worker.stop_recording()
+        worker.run()
+        assert len(errors) == 1 and "device busy" in errors[0]
+        assert not worker.recorder.is_recording()
+
+        worker.reset()
+        worker.stop_recording()
+        worker.run()
+    finally:
+        signals.transcription_complete.disconnect(on_complete)
+        signals.transcription_error.disconnect(on_error)
+
+    assert len(opened) == 2
+    assert len(errors) == 1
+    assert texts == ["160 samples"]
+
+
 if __name__ == "__main__":
     test_recording_worker()